@@ -1,20 +1,40 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional
+import asyncio
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
 # Import simulation functions from the main sim package
 import sys
 import os
-# Add the parent directory to the system path to allow importing from 'sim'
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../python')))
+# Make the parent directory importable when the app is started from api/;
+# skip the insert when it is already on the path (e.g. run from python/)
+_PYTHON_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PYTHON_DIR not in sys.path:
+    sys.path.insert(0, _PYTHON_DIR)
 
 from sim import test_characters, parse_levels
-from collections import defaultdict
-from util.log import log
 
 
-app = FastAPI()
+# orjson serializes the large dpr_results/debug_log payloads much faster
+# than the stdlib json encoder
+app = FastAPI(default_response_class=ORJSONResponse)
+
+# Simulations are CPU-bound; run them in a worker process so the event loop
+# keeps serving other requests while a sweep is in progress. test_characters
+# already spreads each sweep over a Pool of cpu_count processes, so a single
+# executor worker keeps concurrent requests from fanning out to cpu_count**2
+# processes; further sweeps queue behind it. The worker is spawned rather
+# than forked from the (threaded) server process; it then forks its own Pool.
+EXECUTOR_WORKERS = 1
+EXECUTOR = ProcessPoolExecutor(
+    max_workers=EXECUTOR_WORKERS,
+    mp_context=multiprocessing.get_context("spawn"),
+)
 
 # Allow CORS for frontend development
 app.add_middleware(
@@ -34,6 +54,10 @@ class SimulationRequest(BaseModel):
     debug: bool = False
     monster: str = "generic"
 
+@app.on_event("shutdown")
+def shutdown_executor():
+    EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
 @app.get("/health")
 async def health_check():
     return {"status": "ok"}
@@ -42,33 +66,31 @@ async def health_check():
 async def simulate_combat(request: SimulationRequest):
     try:
         start_level, end_level = parse_levels(request.levels)
-        
-        # Temporarily enable log for this request if debug is true
-        if request.debug:
-            log.enable()
-        else:
-            # Ensure log is disabled for non-debug runs to prevent unintended accumulation
-            log.enabled = False
-            # Clear any residual logs from previous debug runs
-            log.record_.clear()
 
-        dpr_results, aggregated_log_data = test_characters(
-            characters=request.characters,
-            start_level=start_level,
-            end_level=end_level,
-            num_rounds=request.num_rounds,
-            num_fights=request.num_fights,
-            iterations=request.iterations,
-            debug=request.debug,
-            monster_name=request.monster,
+        # The simulation runs in an executor process, and test_characters
+        # sets up (and restores) that process's log for the debug flag, so
+        # the request handler never touches the shared log state
+        dpr_results, aggregated_log_data = await asyncio.get_running_loop().run_in_executor(
+            EXECUTOR,
+            functools.partial(
+                test_characters,
+                characters=request.characters,
+                start_level=start_level,
+                end_level=end_level,
+                num_rounds=request.num_rounds,
+                num_fights=request.num_fights,
+                iterations=request.iterations,
+                debug=request.debug,
+                monster_name=request.monster,
+            ),
         )
         
         response_content = {"dpr_results": dpr_results}
         if request.debug and aggregated_log_data:
-            # Convert defaultdict to a regular dict for JSON serialization
+            # Convert the Counter to a regular dict for JSON serialization
             response_content["debug_log"] = dict(aggregated_log_data)
         
-        return response_content
+        return ORJSONResponse(response_content)
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -8,16 +8,14 @@ allowing users to configure parties, enemies, and run turn-based combat.
 from __future__ import annotations
 
 import os
-import sys
+import time
+import uuid
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import asdict
 
+import msgpack
 from flask import Flask, jsonify, render_template, request, session
 from werkzeug.exceptions import BadRequest
-from simulator_exceptions import MonsterLoadException, SimulatorException
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import configs
 import monster_configs
@@ -37,35 +35,225 @@ app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
 
 class SessionKeys:
     """Constants for session key names."""
-    COMBAT_DATA = 'combat_data'
+    COMBAT_ID = 'combat_id'
+
+
+# Seconds a stored combat state is kept after its last update
+COMBAT_STATE_TTL = int(os.environ.get('COMBAT_STATE_TTL', 24 * 60 * 60))
+
+# Most recent log entries kept in the stored combat state; older entries are
+# moved to an append-only archive so the state stays bounded in size
+MAX_STORED_LOG_ENTRIES = 200
+
+
+class CombatStore:
+    """
+    Server-side storage for serialized combat state.
+    
+    The session cookie only carries a combat id; the state itself is packed
+    with msgpack and kept here, so the cookie no longer grows with the log.
+    States live in Redis when a client is given (shared by every worker
+    process) and in process memory otherwise. Either way a state expires
+    once it has gone ttl seconds without an update; in memory, expired
+    states are evicted on the next save.
+    
+    Only the last MAX_STORED_LOG_ENTRIES log entries travel with the state;
+    entries that fall out of that window are appended once to a per-combat
+    log archive, which full_log() joins back together.
+    """
+    
+    KEY_PREFIX = 'combat:'
+    LOG_KEY_PREFIX = 'combat_log:'
+    
+    def __init__(
+        self,
+        redis_client: Any = None,
+        ttl: int = COMBAT_STATE_TTL,
+        max_log_entries: int = MAX_STORED_LOG_ENTRIES
+    ) -> None:
+        """
+        Initialize the store.
+        
+        Args:
+            redis_client: Redis client to store states in (in-memory if None)
+            ttl: Seconds a state is kept after its last update
+            max_log_entries: Log entries kept in the stored state
+        """
+        self._redis = redis_client
+        self._ttl = ttl
+        self._max_log_entries = max_log_entries
+        self._states: Dict[str, bytes] = {}
+        self._log_archives: Dict[str, List[str]] = {}
+        # Last save time per in-memory state, oldest update first
+        self._saved_at: Dict[str, float] = {}
+    
+    def save(self, state: Dict[str, Any], combat_id: Optional[str] = None) -> str:
+        """
+        Pack and store a combat state.
+        
+        Args:
+            state: Serialized combat state
+            combat_id: Id to store the state under (a new one if None)
+            
+        Returns:
+            The combat id the state was stored under
+        """
+        combat_id = combat_id or uuid.uuid4().hex
+        
+        log = state.get('log', [])
+        if len(log) > self._max_log_entries:
+            self._archive_log(combat_id, log[:-self._max_log_entries])
+            state = {**state, 'log': log[-self._max_log_entries:]}
+        
+        packed = msgpack.packb(state, use_bin_type=True)
+        if self._redis is not None:
+            self._redis.set(self.KEY_PREFIX + combat_id, packed, ex=self._ttl)
+            # Keep the log archive alive for as long as its state
+            self._redis.expire(self.LOG_KEY_PREFIX + combat_id, self._ttl)
+        else:
+            now = time.monotonic()
+            self._evict_expired(now)
+            self._states[combat_id] = packed
+            # Re-insert so the dict stays ordered by last update
+            self._saved_at.pop(combat_id, None)
+            self._saved_at[combat_id] = now
+        return combat_id
+    
+    def load(self, combat_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load and unpack a combat state.
+        
+        Args:
+            combat_id: Id the state was stored under
+            
+        Returns:
+            The combat state, or None if no state is stored for the id
+        """
+        if self._redis is not None:
+            packed = self._redis.get(self.KEY_PREFIX + combat_id)
+        else:
+            packed = self._states.get(combat_id)
+        if packed is None:
+            return None
+        return msgpack.unpackb(packed, raw=False)
+    
+    def full_log(self, combat_id: str) -> Optional[List[str]]:
+        """
+        Get the complete combat log, including archived entries.
+        
+        Args:
+            combat_id: Id the state was stored under
+            
+        Returns:
+            Every log entry in order, or None if no state is stored for the id
+        """
+        state = self.load(combat_id)
+        if state is None:
+            return None
+        
+        if self._redis is not None:
+            archived = [
+                entry.decode() if isinstance(entry, bytes) else entry
+                for entry in self._redis.lrange(self.LOG_KEY_PREFIX + combat_id, 0, -1)
+            ]
+        else:
+            archived = self._log_archives.get(combat_id, [])
+        return archived + state['log']
+    
+    def delete(self, combat_id: str) -> None:
+        """Remove a combat state and its log archive if present."""
+        if self._redis is not None:
+            self._redis.delete(self.KEY_PREFIX + combat_id, self.LOG_KEY_PREFIX + combat_id)
+        else:
+            self._states.pop(combat_id, None)
+            self._log_archives.pop(combat_id, None)
+            self._saved_at.pop(combat_id, None)
+    
+    def _archive_log(self, combat_id: str, entries: List[str]) -> None:
+        """Append log entries to a combat's log archive."""
+        if self._redis is not None:
+            key = self.LOG_KEY_PREFIX + combat_id
+            self._redis.rpush(key, *entries)
+            self._redis.expire(key, self._ttl)
+        else:
+            self._log_archives.setdefault(combat_id, []).extend(entries)
+    
+    def _evict_expired(self, now: float) -> None:
+        """Drop in-memory states (and their log archives) past their TTL."""
+        saved_at = self._saved_at
+        while saved_at:
+            oldest = next(iter(saved_at))
+            if now - saved_at[oldest] < self._ttl:
+                break
+            self.delete(oldest)
+
+
+def create_combat_store() -> CombatStore:
+    """
+    Create the combat store for this process.
+    
+    Uses Redis when REDIS_URL is set, so that every worker process sees the
+    same combats; falls back to an in-memory store for single-process runs.
+    
+    Returns:
+        Configured CombatStore
+    """
+    redis_url = os.environ.get('REDIS_URL')
+    if not redis_url:
+        return CombatStore()
+    
+    import redis
+    return CombatStore(redis.Redis.from_url(redis_url))
+
+
+combat_store = create_combat_store()
+
+
+def combatants_payload(combat: sim.party_sim.Combat) -> List[Dict[str, Any]]:
+    """
+    Build the per-combatant state shared by the session and the API response.
+    
+    Args:
+        combat: The combat instance
+        
+    Returns:
+        List of combatant dictionaries
+    """
+    return [
+        {
+            'name': c.name,
+            'team': c.team,
+            'hp': c.current_hp,
+            'max_hp': c.entity.max_hp,
+            'is_down': c.is_down,
+        }
+        for c in combat.combatants
+    ]
 
 
 class CombatStateManager:
     """Manages combat state serialization and deserialization for sessions."""
     
     @staticmethod
-    def serialize_combat(combat: sim.party_sim.Combat, combat_config: Dict[str, Any]) -> Dict[str, Any]:
+    def serialize_combat(
+        combat: sim.party_sim.Combat,
+        combat_config: Dict[str, Any],
+        combatants: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """
         Serialize combat state to a JSON-compatible dictionary.
         
         Args:
             combat: The combat instance to serialize
             combat_config: The combat configuration to include
+            combatants: Prebuilt combatants payload (built if None)
             
         Returns:
             Dictionary containing serializable combat state
         """
         return {
             'config': combat_config,
-            'combatants': [
-                {
-                    'name': c.name,
-                    'hp': c.current_hp,
-                    'max_hp': c.entity.max_hp,
-                    'is_down': c.is_down
-                }
-                for c in combat.combatants
-            ],
+            'combatants': combatants if combatants is not None else combatants_payload(combat),
             'turn_order': [c.name for c in combat.turn_order],
             'rounds': combat.rounds,
             'log': combat.combat_log
@@ -119,15 +307,15 @@ class CombatStateManager:
         # Restore combatant state
         combatant_map = {c.name: c for c in combat.combatants}
         for combatant_data in session_data['combatants']:
-            if combatant_data['name'] in combatant_map:
-                c = combatant_map[combatant_data['name']]
+            c = combatant_map.get(combatant_data['name'])
+            if c is not None:
                 c.entity.hp = combatant_data['hp']
                 c.current_hp = combatant_data['hp']
                 c.is_down = combatant_data['is_down']
         
         # Ensure spell slots are initialized for party members after deserialization
         for party_member_combatant in combat.party:
-            if hasattr(party_member_combatant.entity, 'spells') and party_member_combatant.entity.spells:
+            if party_member_combatant.entity.HAS_SPELLS:
                 party_member_combatant.entity.long_rest()
                 app.logger.debug(f"Performed long_rest for {party_member_combatant.name} to initialize spell slots.")
 
@@ -149,30 +337,28 @@ class CombatStateManager:
         return combat
 
 
-def get_combat_state_json(combat: sim.party_sim.Combat) -> Dict[str, Any]:
+def get_combat_state_json(
+    combat: sim.party_sim.Combat,
+    combatants: Optional[List[Dict[str, Any]]] = None,
+    is_over: Optional[bool] = None
+) -> Dict[str, Any]:
     """
     Create a JSON-serializable representation of current combat state.
     
     Args:
         combat: The combat instance
+        combatants: Prebuilt combatants payload (built if None)
+        is_over: Precomputed combat.is_over() result (computed if None)
         
     Returns:
         Dictionary with combat state information
     """
-    is_over = combat.is_over()
+    if is_over is None:
+        is_over = combat.is_over()
     
     return {
         'rounds': combat.rounds,
-        'combatants': [
-            {
-                'name': c.name,
-                'team': c.team,
-                'hp': c.current_hp,
-                'max_hp': c.entity.max_hp,
-                'is_down': c.is_down,
-            }
-            for c in combat.combatants
-        ],
+        'combatants': combatants if combatants is not None else combatants_payload(combat),
         'turn_order': [c.name for c in combat.turn_order],
         'log': combat.combat_log,
         'is_over': is_over,
@@ -277,9 +463,7 @@ def start_combat():
     # Store config for session (with names, not classes)
     combat_config_for_session = {
         "party": data['party'],
-        "enemies": [(name, count) for (_, count), enemy_data 
-                   in zip(enemy_classes_and_counts, data['enemies'])
-                   for name in [enemy_data['name']]],
+        "enemies": [(e['name'], int(e['count'])) for e in data['enemies']],
         "level": int(data['level'])
     }
     
@@ -294,13 +478,21 @@ def start_combat():
     combat = combat_manager.create_combat(use_hooks=False)
     combat.setup_combat()
 
-    # Store in session
-    session[SessionKeys.COMBAT_DATA] = CombatStateManager.serialize_combat(combat, combat_config_for_session)
+    # Drop the previous combat so its archived log cannot leak into this one
+    old_combat_id = session.get(SessionKeys.COMBAT_ID)
+    if old_combat_id is not None:
+        combat_store.delete(old_combat_id)
+    
+    # Store server-side under a fresh id, keeping only the id in the session
+    combatants = combatants_payload(combat)
+    session[SessionKeys.COMBAT_ID] = combat_store.save(
+        CombatStateManager.serialize_combat(combat, combat_config_for_session, combatants)
+    )
     
     app.logger.info(f"Started combat: {len(data['party'])} party members vs "
                    f"{len(data['enemies'])} enemy types")
     
-    return jsonify(get_combat_state_json(combat))
+    return jsonify(get_combat_state_json(combat, combatants))
 
 
 @app.route('/api/next_turn', methods=['POST'])
@@ -311,12 +503,12 @@ def next_turn():
     Returns:
         JSON response with updated combat state or error
     """
-    if SessionKeys.COMBAT_DATA not in session:
+    combat_id = session.get(SessionKeys.COMBAT_ID)
+    session_data = combat_store.load(combat_id) if combat_id else None
+    if session_data is None:
         return jsonify({
             'error': 'No active combat. Please start a new combat.'
         }), 400
-
-    session_data = session[SessionKeys.COMBAT_DATA]
     
     # Reconstruct combat from session
     combat = CombatStateManager.deserialize_combat(
@@ -330,13 +522,39 @@ def next_turn():
         combat.run_combat_turn()
         app.logger.debug(f"Executed turn, now at round {combat.rounds}")
 
-    # Update session with new state
-    session[SessionKeys.COMBAT_DATA] = CombatStateManager.serialize_combat(combat, session_data['config'])
+    # Update stored state
+    combatants = combatants_payload(combat)
+    combat_store.save(
+        CombatStateManager.serialize_combat(combat, session_data['config'], combatants),
+        combat_id
+    )
     
-    if combat.is_over():
+    is_over = combat.is_over()
+    if is_over:
         app.logger.info(f"Combat ended. Winner: {combat._determine_winner()}")
 
-    return jsonify(get_combat_state_json(combat))
+    return jsonify(get_combat_state_json(combat, combatants, is_over))
+
+
+@app.route('/api/combat_log', methods=['GET'])
+def combat_log():
+    """
+    Get the complete log of the current combat.
+    
+    The stored combat state only keeps the most recent log entries; this
+    endpoint also returns the archived ones.
+    
+    Returns:
+        JSON response with the full log or error
+    """
+    combat_id = session.get(SessionKeys.COMBAT_ID)
+    log = combat_store.full_log(combat_id) if combat_id else None
+    if log is None:
+        return jsonify({
+            'error': 'No active combat. Please start a new combat.'
+        }), 400
+    
+    return jsonify({'log': log})
 
 
 @app.route('/api/reset_combat', methods=['POST'])
@@ -347,8 +565,9 @@ def reset_combat():
     Returns:
         JSON response confirming reset
     """
-    if SessionKeys.COMBAT_DATA in session:
-        session.pop(SessionKeys.COMBAT_DATA)
+    combat_id = session.pop(SessionKeys.COMBAT_ID, None)
+    if combat_id is not None:
+        combat_store.delete(combat_id)
         app.logger.info("Combat session reset")
     
     return jsonify({'success': True, 'message': 'Combat reset successfully'})
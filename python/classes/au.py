@@ -6,7 +6,7 @@ import random
 
 from feats import ASI, AttackAction
 from util.util import get_magic_weapon
-from classes.fighter import ActionSurge
+from classes.fighter import ActionSurge, get_num_attacks
 from typing import List
 
 import sim.feat
@@ -16,6 +16,8 @@ import sim.weapons
 
 
 class OldCrossbowExpert(sim.feat.Feat):
+    __slots__ = ("weapon",)
+
     def __init__(self, weapon: sim.weapons.Weapon) -> None:
         self.weapon = weapon
 
@@ -29,6 +31,8 @@ class OldCrossbowExpert(sim.feat.Feat):
 
 
 class OldSharpshooter(sim.feat.Feat):
+    __slots__ = ()
+
     def apply(self, character):
         super().apply(character)
         character.increase_stat("dex", 1)
@@ -43,6 +47,8 @@ class OldSharpshooter(sim.feat.Feat):
 
 
 class FightingSpirit(sim.feat.Feat):
+    __slots__ = ("enabled", "regain_on_initiative")
+
     def __init__(self, regain_on_initiative: bool = False) -> None:
         self.enabled = False
         self.regain_on_initiative = regain_on_initiative
@@ -65,6 +71,8 @@ class FightingSpirit(sim.feat.Feat):
 
 
 class RapidStrike(sim.feat.Feat):
+    __slots__ = ("used",)
+
     def __init__(self) -> None:
         self.used = False
 
@@ -83,26 +91,34 @@ class OldHandCrossbow(sim.weapons.Weapon):
         super().__init__(name="OldHandCrossbow", num_dice=1, die=6, **kwargs)
 
 
+# Blessed adds a d4 to every attack; draw the rolls in batches instead of
+# calling random.randint once per attack
+BLESSED_D4 = (1, 2, 3, 4)
+BLESSED_BATCH_SIZE = 4096
+
+
 class Blessed(sim.feat.Feat):
+    __slots__ = ("rolls", "next_roll")
+
+    def __init__(self) -> None:
+        self.rolls: List[int] = []
+        self.next_roll = 0
+
     def attack_roll(self, args):
-        args.situational_bonus += random.randint(1, 4)
+        if self.next_roll >= len(self.rolls):
+            self.rolls = random.choices(BLESSED_D4, k=BLESSED_BATCH_SIZE)
+            self.next_roll = 0
+        args.situational_bonus += self.rolls[self.next_roll]
+        self.next_roll += 1
 
 
 class AssaultUnit(sim.character.Character):
     def __init__(self, level: int, blessed: bool = False, **kwargs) -> None:
         self.name = "AssaultUnit"
         magic_weapon = get_magic_weapon(level)
-        weapon = OldHandCrossbow(bonus=magic_weapon)
+        weapon = OldHandCrossbow(magic_bonus=magic_weapon)
         base_feats: List["sim.feat.Feat"] = []
-        if level >= 20:
-            attacks = 4 * [weapon]
-        elif level >= 11:
-            attacks = 3 * [weapon]
-        elif level >= 5:
-            attacks = 2 * [weapon]
-        else:
-            attacks = [weapon]
-        base_feats.append(AttackAction(attacks=attacks))
+        base_feats.append(AttackAction(attacks=[(weapon, get_num_attacks(level))]))
         if level >= 2:
             base_feats.append(ActionSurge(max_surges=2 if level >= 17 else 1))
         if level >= 3:
@@ -120,7 +136,7 @@ class AssaultUnit(sim.character.Character):
         super().__init__(
             name=self.name,
             level=level,
-            stats=[10, 17, 10, 10, 10, 10],
+            stats=(10, 17, 10, 10, 10, 10),
             base_feats=base_feats,
             ac=18,
         )
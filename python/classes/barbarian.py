@@ -9,7 +9,7 @@ from typing import List, Optional
 from enum import IntEnum
 
 import sim.core_feats
-from util.util import get_magic_weapon, apply_asi_feats
+from util.util import get_magic_weapon, apply_asi_feats, at_level, level_table
 from feats.epic_boons import IrresistibleOffense
 from feats.origin import SavageAttacker
 from feats import (
@@ -71,6 +71,11 @@ BRUTAL_STRIKE_DICE = {
     17: 2,  # Levels 17-20
 }
 
+# Per-level lookup tables built from the threshold maps above
+_RAGE_DAMAGE = level_table(RAGE_DAMAGE_BY_LEVEL, default=2)
+_NUM_RAGES = level_table(RAGES_BY_LEVEL, default=2)
+_BRUTAL_STRIKE_DICE = level_table(BRUTAL_STRIKE_DICE, default=1)
+
 # Primal Champion stat increases
 PRIMAL_CHAMPION_STR_BONUS = 4
 PRIMAL_CHAMPION_CON_BONUS = 4
@@ -90,10 +95,7 @@ def rage_damage(level: int) -> int:
     Returns:
         Rage damage bonus
     """
-    for threshold in sorted(RAGE_DAMAGE_BY_LEVEL.keys(), reverse=True):
-        if level >= threshold:
-            return RAGE_DAMAGE_BY_LEVEL[threshold]
-    return 2  # Default for level 1
+    return at_level(_RAGE_DAMAGE, level)
 
 
 def num_rages(level: int) -> int:
@@ -106,10 +108,7 @@ def num_rages(level: int) -> int:
     Returns:
         Number of rages.
     """
-    for threshold in sorted(RAGES_BY_LEVEL.keys(), reverse=True):
-        if level >= threshold:
-            return RAGES_BY_LEVEL[threshold]
-    return 2 # Default for level 1
+    return at_level(_NUM_RAGES, level)
 
 
 def get_brutal_strike_dice(level: int) -> int:
@@ -122,10 +121,7 @@ def get_brutal_strike_dice(level: int) -> int:
     Returns:
         Number of d10 dice for Brutal Strike
     """
-    for threshold in sorted(BRUTAL_STRIKE_DICE.keys(), reverse=True):
-        if level >= threshold:
-            return BRUTAL_STRIKE_DICE[threshold]
-    return 1  # Default for level 9
+    return at_level(_BRUTAL_STRIKE_DICE, level)
 
 
 # ============================================================================
@@ -156,6 +152,8 @@ class Rage(sim.feat.Feat):
     
     Rage damage increases at levels 9 and 16.
     """
+
+    __slots__ = ("raging", "dmg", "max_rages")
     
     def __init__(self, dmg: int, max_rages: int):
         """
@@ -207,6 +205,8 @@ class RecklessAttack(sim.feat.Feat):
     Note: The downside (granting advantage to attacks against you) is not
     implemented as it's not relevant to DPR calculations.
     """
+
+    __slots__ = ("enabled",)
     
     def __init__(self):
         """Initialize Reckless Attack tracking."""
@@ -251,6 +251,8 @@ class BrutalStrike(sim.feat.Feat):
     apply a special effect (not fully implemented).
     """
     
+    __slots__ = ("num_dice", "dice", "used")
+
     # Die type for Brutal Strike damage
     DIE_TYPE = 10
     
@@ -263,6 +265,7 @@ class BrutalStrike(sim.feat.Feat):
         """
         super().__init__()
         self.num_dice: int = num_dice
+        self.dice = (self.DIE_TYPE,) * num_dice
         self.used: bool = False
 
     def begin_turn(self, target: "sim.target.Target") -> None:
@@ -294,10 +297,7 @@ class BrutalStrike(sim.feat.Feat):
             args: Attack result arguments
         """
         if args.hits() and args.attack.has_tag("brutal_strike"):
-            args.add_damage(
-                source="BrutalStrike",
-                dice=self.num_dice * [self.DIE_TYPE]
-            )
+            args.add_damage(source="BrutalStrike", dice=self.dice)
 
 
 class PrimalChampion(sim.feat.Feat):
@@ -307,6 +307,8 @@ class PrimalChampion(sim.feat.Feat):
     Increases Strength and Constitution scores and maximums by 4.
     This represents the pinnacle of physical perfection.
     """
+
+    __slots__ = ()
     
     def apply(self, character: "sim.character.Character") -> None:
         """
@@ -339,6 +341,8 @@ class Frenzy(sim.feat.Feat):
     
     Example: At level 3-8 (rage bonus +2), deal 2d6 extra damage.
     """
+
+    __slots__ = ("last_used_turn", "num_dice", "dice")
     
     # Die type for Frenzy damage
     DIE_TYPE = 6
@@ -351,17 +355,9 @@ class Frenzy(sim.feat.Feat):
             num_dice: Number of d6 dice (equals rage damage bonus)
         """
         super().__init__()
-        self.used: bool = False
+        self.last_used_turn: int = -1
         self.num_dice: int = num_dice
-
-    def begin_turn(self, target: "sim.target.Target") -> None:
-        """
-        Reset Frenzy usage at the start of turn.
-        
-        Args:
-            target: Combat target
-        """
-        self.used = False
+        self.dice = (self.DIE_TYPE,) * num_dice
 
     def attack_result(self, args) -> None:
         """
@@ -370,12 +366,10 @@ class Frenzy(sim.feat.Feat):
         Args:
             args: Attack result arguments
         """
-        if args.hits() and not self.used:
-            self.used = True
-            args.add_damage(
-                source="Berserker",
-                dice=self.num_dice * [self.DIE_TYPE]
-            )
+        turn = self.character.turn_count
+        if args.hits() and self.last_used_turn != turn:
+            self.last_used_turn = turn
+            args.add_damage(source="Berserker", dice=self.dice)
 
 
 class Retaliation(sim.feat.Feat):
@@ -387,6 +381,8 @@ class Retaliation(sim.feat.Feat):
     
     Simplified for simulation: Make an extra attack during enemy turn.
     """
+
+    __slots__ = ("weapon",)
     
     def __init__(self, weapon: "sim.weapons.Weapon"):
         """
@@ -534,7 +530,7 @@ class PolearmBarbarian(sim.character.Character):
         super().__init__(
             name=self.name,
             level=level,
-            stats=[17, 10, 10, 10, 10, 10],  # High Str, average everything else
+            stats=(17, 10, 10, 10, 10, 10),  # High Str, average everything else
             base_feats=feats,
         )
 
@@ -590,6 +586,6 @@ class BerserkerBarbarian(sim.character.Character):
         super().__init__(
             name=self.name,
             level=level,
-            stats=[17, 10, 10, 10, 10, 10],  # High Str, average everything else
+            stats=(17, 10, 10, 10, 10, 10),  # High Str, average everything else
             base_feats=feats,
         )
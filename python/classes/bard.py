@@ -113,7 +113,7 @@ class TrueStrikeAction(sim.feat.Feat):
         for attack in self.attacks:
             self.character.weapon_attack(target, attack)
         for attack in self.nick_attacks:
-            self.character.weapon_attack(target, attack, tags=["light"])
+            self.character.weapon_attack(target, attack, tags=("light",))
 
 
 class ValorBardBonusAttack(sim.feat.Feat):
@@ -158,7 +158,7 @@ class ValorBard(sim.character.Character):
         super().__init__(
             name=self.name,
             level=level,
-            stats=[10, 16, 10, 10, 10, 17],
+            stats=(10, 16, 10, 10, 10, 17),
             base_feats=feats,
             spell_mod="cha",
         )
@@ -272,7 +272,7 @@ class CMEMulticlass(sim.character.Character):
         super().__init__(
             name=self.name,
             level=level,
-            stats=[10, 16, 10, 10, 10, 17],
+            stats=(10, 16, 10, 10, 10, 17),
             base_feats=feats,
             spell_mod="cha",
         )
@@ -8,7 +8,7 @@ Channel Divinity, Blessed Strikes, and the War Domain subclass.
 from typing import List, Optional
 from enum import IntEnum
 
-from util.util import get_magic_weapon, apply_asi_feats
+from util.util import get_magic_weapon, apply_asi_feats, at_level, level_table
 from sim.spells import Spellcaster
 from feats import ASI, AddResource
 from spells.cleric import (
@@ -52,14 +52,43 @@ BLESSED_STRIKES_DICE = {
     14: 2,  # 2d8 radiant damage
 }
 
+# Per-level lookup tables built from the threshold maps above
+_BLESSED_STRIKES_DICE = level_table(BLESSED_STRIKES_DICE, default=1)
+_NUM_CHANNEL_DIVINITY = level_table(
+    {
+        ClericLevels.CHANNEL_DIVINITY_1: 1,
+        ClericLevels.CHANNEL_DIVINITY_2: 2,
+        ClericLevels.CHANNEL_DIVINITY_3: 3,
+    },
+    default=0,
+)
+
 # Spell slot thresholds for spell selection
 SUMMON_CELESTIAL_SLOT = 5
 SPIRIT_GUARDIANS_SLOT = 3
 GUARDIAN_OF_FAITH_SLOT = 4
 INFLICT_WOUNDS_SLOT = 1
 
+# Highest slot usable for the non-concentration damage spells
+MAX_DAMAGE_SPELL_SLOT = 4
+
+# Spell to cast, indexed by the slot level ClericAction would use. None
+# means no spell of that kind fits the slot.
+_CONCENTRATION_SPELL_BY_SLOT = tuple(
+    SummonCelestial if slot >= SUMMON_CELESTIAL_SLOT
+    else SpiritGuardians if slot >= SPIRIT_GUARDIANS_SLOT
+    else None
+    for slot in range(10)
+)
+_DAMAGE_SPELL_BY_SLOT = tuple(
+    GuardianOfFaith if slot >= GUARDIAN_OF_FAITH_SLOT
+    else InflictWounds if slot >= INFLICT_WOUNDS_SLOT
+    else None
+    for slot in range(MAX_DAMAGE_SPELL_SLOT + 1)
+)
+
 # Default ability scores for Cleric (Wis primary, Str secondary for War Domain)
-DEFAULT_CLERIC_STATS = [15, 10, 10, 10, 17, 10]
+DEFAULT_CLERIC_STATS = (15, 10, 10, 10, 17, 10)
 
 
 # ============================================================================
@@ -76,10 +105,7 @@ def get_blessed_strikes_dice(level: int) -> int:
     Returns:
         Number of d8 dice for Blessed Strikes
     """
-    for threshold in sorted(BLESSED_STRIKES_DICE.keys(), reverse=True):
-        if level >= threshold:
-            return BLESSED_STRIKES_DICE[threshold]
-    return 1  # Default for level 7
+    return at_level(_BLESSED_STRIKES_DICE, level)
 
 
 def num_channel_divinity(level: int) -> int:
@@ -92,13 +118,7 @@ def num_channel_divinity(level: int) -> int:
     Returns:
         Number of Channel Divinity uses.
     """
-    if level >= 18:
-        return 3
-    elif level >= 6:
-        return 2
-    elif level >= 2:
-        return 1
-    return 0
+    return at_level(_NUM_CHANNEL_DIVINITY, level)
 
 
 # ============================================================================
@@ -112,6 +132,8 @@ class ClericLevel(sim.core_feats.ClassLevels):
     Clerics are full spellcasters, gaining the maximum spell slots
     for their level and having access to their entire spell list.
     """
+
+    __slots__ = ()
     
     def __init__(self, level: int):
         """
@@ -138,6 +160,8 @@ class ClericAction(sim.feat.Feat):
     
     This represents an optimized Cleric focusing on damage output.
     """
+
+    __slots__ = ()
     
     def action(self, target: "sim.target.Target") -> None:
         """
@@ -146,33 +170,26 @@ class ClericAction(sim.feat.Feat):
         Args:
             target: The target to attack/affect
         """
-        slot = self.character.spells.highest_slot()
-        spell: Optional["sim.spells.Spell"] = None
+        spells = self.character.spells
+        spell_class = None
         
         # If not concentrating, prioritize concentration spells
-        if not self.character.spells.is_concentrating() and slot >= SPIRIT_GUARDIANS_SLOT:
-            if slot >= SUMMON_CELESTIAL_SLOT:
-                # Best concentration spell: Summon Celestial
-                spell = SummonCelestial(slot)
-            elif slot >= SPIRIT_GUARDIANS_SLOT:
-                # Second best: Spirit Guardians
-                spell = SpiritGuardians(slot)
-        else:
-            # Already concentrating or no high-level slots
-            # Use non-concentration damage spells
-            slot = self.character.spells.highest_slot(max_slot=4)
-            
-            if slot >= GUARDIAN_OF_FAITH_SLOT:
-                spell = GuardianOfFaith(slot)
-            elif slot >= INFLICT_WOUNDS_SLOT:
-                spell = InflictWounds(slot)
-            else:
-                # No spell slots left, use cantrip
-                spell = TollTheDead()
+        # (Summon Celestial, then Spirit Guardians)
+        if not spells.is_concentrating():
+            slot = spells.highest_slot()
+            spell_class = _CONCENTRATION_SPELL_BY_SLOT[slot]
+        
+        # Already concentrating or no high-level slots:
+        # use non-concentration damage spells
+        if spell_class is None:
+            slot = spells.highest_slot(max_slot=MAX_DAMAGE_SPELL_SLOT)
+            spell_class = _DAMAGE_SPELL_BY_SLOT[slot]
         
-        # Cast the chosen spell
-        if spell is not None:
-            self.character.spells.cast(spell, target)
+        if spell_class is None:
+            # No spell slots left, use cantrip
+            spells.cast(TollTheDead(), target)
+        else:
+            spells.cast(spell_class(slot), target)
 
 
 class BlessedStrikes(sim.feat.Feat):
@@ -185,6 +202,8 @@ class BlessedStrikes(sim.feat.Feat):
     
     This provides consistent extra damage to the Cleric's attacks.
     """
+
+    __slots__ = ("num_dice", "dice", "last_used_turn")
     
     # Damage type for Blessed Strikes
     DIE_TYPE = 8
@@ -198,16 +217,8 @@ class BlessedStrikes(sim.feat.Feat):
         """
         super().__init__()
         self.num_dice: int = num_dice
-        self.used: bool = False
-
-    def begin_turn(self, target: "sim.target.Target") -> None:
-        """
-        Reset Blessed Strikes usage at the start of each turn.
-        
-        Args:
-            target: Combat target
-        """
-        self.used = False
+        self.dice = (self.DIE_TYPE,) * num_dice
+        self.last_used_turn: int = -1
 
     def attack_result(self, args) -> None:
         """
@@ -216,12 +227,10 @@ class BlessedStrikes(sim.feat.Feat):
         Args:
             args: Attack result arguments
         """
-        if args.hits() and not self.used:
-            self.used = True
-            args.add_damage(
-                "BlessedStrikes",
-                dice=self.num_dice * [self.DIE_TYPE]
-            )
+        turn = self.character.turn_count
+        if args.hits() and self.last_used_turn != turn:
+            self.last_used_turn = turn
+            args.add_damage("BlessedStrikes", dice=self.dice)
 
 
 # ============================================================================
@@ -238,6 +247,8 @@ class WarPriest(sim.feat.Feat):
     
     Recharges on short rest.
     """
+
+    __slots__ = ("weapon", "resource")
     
     def __init__(self, weapon: "sim.weapons.Weapon") -> None:
         """
@@ -258,7 +269,7 @@ class WarPriest(sim.feat.Feat):
         """
         super().apply(character)
         max_uses = max(1, character.mod('wis'))
-        character.add_resource('War Priest', max_uses=max_uses, short_rest=True)
+        self.resource = character.add_resource('War Priest', max_uses=max_uses, short_rest=True)
 
     def after_action(self, target: "sim.target.Target") -> None:
         """
@@ -267,7 +278,7 @@ class WarPriest(sim.feat.Feat):
         Args:
             target: Combat target
         """
-        if self.character.resources['War Priest'].use(detail="War Priest Attack", target=target) and self.character.use_bonus("WarPriest"):
+        if self.resource.use(detail="War Priest Attack", target=target) and self.character.use_bonus("WarPriest"):
             self.character.weapon_attack(target, self.weapon)
 
 
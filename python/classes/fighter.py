@@ -5,12 +5,11 @@ This module implements Fighter class features, subclasses (Champion, Battlemaste
 and various fighting styles including Great Weapon Fighting and Two-Weapon Fighting.
 """
 
-import random
 from typing import List, Optional
 from enum import IntEnum
 
 import sim.core_feats
-from util.util import get_magic_weapon, apply_asi_feats
+from util.util import get_magic_weapon, apply_asi_feats, at_level, level_table, roll_d20
 from feats.epic_boons import IrresistibleOffense
 from feats.fighting_style import TwoWeaponFighting, GreatWeaponFighting
 from feats.origin import SavageAttacker
@@ -75,6 +74,17 @@ MANEUVER_DICE_BY_LEVEL = {
     18: (6, 12),
 }
 
+# Per-level lookup tables built from the threshold maps above
+_MANEUVER_DICE = level_table(MANEUVER_DICE_BY_LEVEL, default=(4, 8))
+_NUM_ATTACKS = level_table(
+    {
+        FighterLevels.EXTRA_ATTACK_1: 2,
+        FighterLevels.EXTRA_ATTACK_2: 3,
+        FighterLevels.EXTRA_ATTACK_3: 4,
+    },
+    default=1,
+)
+
 # Critical hit thresholds
 CRIT_THRESHOLD_IMPROVED = 19
 CRIT_THRESHOLD_SUPERIOR = 18
@@ -107,14 +117,7 @@ def get_num_attacks(level: int) -> int:
         >>> get_num_attacks(20)
         4
     """
-    if level >= FighterLevels.EXTRA_ATTACK_3:
-        return 4
-    elif level >= FighterLevels.EXTRA_ATTACK_2:
-        return 3
-    elif level >= FighterLevels.EXTRA_ATTACK_1:
-        return 2
-    else:
-        return 1
+    return at_level(_NUM_ATTACKS, level)
 
 
 def get_maneuver_stats(level: int) -> tuple[int, int]:
@@ -127,10 +130,7 @@ def get_maneuver_stats(level: int) -> tuple[int, int]:
     Returns:
         Tuple of (number_of_dice, die_size)
     """
-    for threshold in sorted(MANEUVER_DICE_BY_LEVEL.keys(), reverse=True):
-        if level >= threshold:
-            return MANEUVER_DICE_BY_LEVEL[threshold]
-    return (4, 8)  # Default for level 3
+    return at_level(_MANEUVER_DICE, level)
 
 
 # ============================================================================
@@ -139,6 +139,8 @@ def get_maneuver_stats(level: int) -> tuple[int, int]:
 
 class FighterLevel(sim.core_feats.ClassLevels):
     """Represents Fighter class levels and core features."""
+
+    __slots__ = ()
     
     def __init__(self, level: int):
         """
@@ -157,6 +159,8 @@ class StudiedAttacks(sim.feat.Feat):
     When you miss an attack, you gain advantage on your next attack roll.
     This represents learning from mistakes and adapting tactics mid-combat.
     """
+
+    __slots__ = ("enabled",)
     
     def __init__(self) -> None:
         """Initialize Studied Attacks with disabled state."""
@@ -192,6 +196,8 @@ class ActionSurge(sim.feat.Feat):
     Allows taking an additional action on your turn. Recharges on short rest.
     Gains a second use at level 17.
     """
+
+    __slots__ = ("max_surges", "resource")
     
     def __init__(self, max_surges: int) -> None:
         """
@@ -211,7 +217,7 @@ class ActionSurge(sim.feat.Feat):
             character: The character to apply this feat to.
         """
         super().apply(character)
-        character.add_resource('Action Surge', max_uses=self.max_surges, short_rest=True)
+        self.resource = character.add_resource('Action Surge', max_uses=self.max_surges, short_rest=True)
 
     def before_action(self, target: "sim.target.Target") -> None:
         """
@@ -220,7 +226,7 @@ class ActionSurge(sim.feat.Feat):
         Args:
             target: Combat target
         """
-        if self.character.resources['Action Surge'].use(detail="Action Surge", target=target):
+        if self.resource.use(detail="Action Surge", target=target):
             self.character.actions += 1
 
 
@@ -236,6 +242,8 @@ class ImprovedCritical(sim.feat.Feat):
     Level 3: Critical hits on 19-20
     Level 15: Critical hits on 18-20
     """
+
+    __slots__ = ("min_crit",)
     
     def __init__(self, min_crit: int):
         """
@@ -254,10 +262,7 @@ class ImprovedCritical(sim.feat.Feat):
         Args:
             args: Attack roll arguments
         """
-        if args.min_crit:
-            args.min_crit = min(args.min_crit, self.min_crit)
-        else:
-            args.min_crit = self.min_crit
+        args.min_crit = min(args.min_crit, self.min_crit)
 
 
 class HeroicAdvantage(sim.feat.Feat):
@@ -267,6 +272,8 @@ class HeroicAdvantage(sim.feat.Feat):
     When you roll lower than 8 on an attack, you can reroll with advantage.
     This ability can be used once per turn.
     """
+
+    __slots__ = ("last_used_turn",)
     
     # Threshold for triggering reroll
     REROLL_THRESHOLD = 8
@@ -274,16 +281,7 @@ class HeroicAdvantage(sim.feat.Feat):
     def __init__(self) -> None:
         """Initialize Heroic Advantage tracking."""
         super().__init__()
-        self.used: bool = False
-
-    def begin_turn(self, target: "sim.target.Target") -> None:
-        """
-        Reset usage at the start of each turn.
-        
-        Args:
-            target: Combat target
-        """
-        self.used = False
+        self.last_used_turn: int = -1
 
     def attack_roll(self, args) -> None:
         """
@@ -292,22 +290,23 @@ class HeroicAdvantage(sim.feat.Feat):
         Args:
             args: Attack roll arguments
         """
+        turn = self.character.turn_count
         # Don't apply if already used this turn or if already have advantage
-        if self.used or args.adv:
+        if self.last_used_turn == turn or args.adv:
             return
             
         # Handle disadvantage case
         if args.disadv:
             roll = args.roll()
             if roll < self.REROLL_THRESHOLD:
-                self.used = True
+                self.last_used_turn = turn
                 args.adv = True
-                args.roll1 = random.randint(1, 20)
+                args.roll1 = roll_d20()
         else:
             # Normal roll case
             roll = args.roll1
             if roll < self.REROLL_THRESHOLD:
-                self.used = True
+                self.last_used_turn = turn
                 args.adv = True
 
 
@@ -322,6 +321,8 @@ class CombatSuperiority(sim.feat.Feat):
     Grants superiority dice that can be used for maneuvers.
     Dice number and size improve at higher levels.
     """
+
+    __slots__ = ("level",)
     
     def __init__(self, level: int) -> None:
         """
@@ -353,6 +354,8 @@ class Relentless(sim.feat.Feat):
     When you roll initiative with no superiority dice remaining,
     you regain one expended die.
     """
+
+    __slots__ = ()
     
     def apply(self, character: "sim.character.Character") -> None:
         """
@@ -372,6 +375,8 @@ class PrecisionAttack(sim.feat.Feat):
     When you make an attack roll, you can add a superiority die
     to improve your chance to hit.
     """
+
+    __slots__ = ("low",)
     
     def __init__(self, low: int = 5) -> None:
         """
@@ -408,6 +413,8 @@ class TrippingAttack(sim.feat.Feat):
     When you hit with an attack, you can add a superiority die to damage
     and force the target to make a Strength save or be knocked prone.
     """
+
+    __slots__ = ()
     
     def attack_result(self, args) -> None:
         """
@@ -420,12 +427,13 @@ class TrippingAttack(sim.feat.Feat):
         if args.misses():
             return
             
-        # Don't use if already used a maneuver
-        if args.attack.has_tag("used_maneuver"):
+        # Don't waste it if target is already prone (checked before the
+        # tag lookup since it is a plain attribute read)
+        if args.attack.target.prone:
             return
             
-        # Don't waste it if target is already prone
-        if args.attack.target.prone:
+        # Don't use if already used a maneuver
+        if args.attack.has_tag("used_maneuver"):
             return
             
         # Use superiority die
@@ -434,7 +442,7 @@ class TrippingAttack(sim.feat.Feat):
             args.add_damage(source="TrippingAttack", dice=[die])
             
             # Force save to avoid being knocked prone
-            if not args.attack.target.save(self.character.dc("str")):
+            if not args.attack.target.save("str", self.character.dc("str")):
                 args.attack.target.knock_prone()
                 
             args.attack.add_tag("used_maneuver")
@@ -451,6 +459,8 @@ class DefaultFighterAction(sim.feat.Feat):
     Handles multiple attacks, optional Topple mastery usage,
     and Nick weapon attacks for Two-Weapon Fighting.
     """
+
+    __slots__ = ("num_attacks", "weapon", "topple_weapon", "nick_weapon", "topple_attacks")
     
     def __init__(
         self,
@@ -473,6 +483,10 @@ class DefaultFighterAction(sim.feat.Feat):
         self.weapon: "sim.weapons.Weapon" = weapon
         self.topple_weapon: Optional["sim.weapons.Weapon"] = topple_weapon
         self.nick_weapon: Optional["sim.weapons.Weapon"] = nick_weapon
+        # Topple is tried on every attack but the last, so it is not wasted
+        self.topple_attacks: int = (
+            self.num_attacks - 1 if topple_weapon is not None else 0
+        )
 
     def action(self, target: "sim.target.Target") -> None:
         """
@@ -484,24 +498,18 @@ class DefaultFighterAction(sim.feat.Feat):
         Args:
             target: The target to attack
         """
-        # Main attacks
+        # Main attacks; prone is re-checked per attack since Topple can land
         for i in range(self.num_attacks):
-            weapon = self.weapon
-            
-            # Use Topple weapon if beneficial
-            if (
-                self.topple_weapon is not None
-                and not target.prone
-                and i < self.num_attacks - 1  # Don't use on last attack
-            ):
+            if i < self.topple_attacks and not target.prone:
                 weapon = self.topple_weapon
-                
-            self.character.weapon_attack(target, weapon, tags=["main_action"])
+            else:
+                weapon = self.weapon
+            self.character.weapon_attack(target, weapon, tags=("main_action",))
         
         # Nick weapon bonus attack if available
         if self.nick_weapon:
             self.character.weapon_attack(
-                target, self.nick_weapon, tags=["main_action", "light"]
+                target, self.nick_weapon, tags=("main_action", "light")
             )
 
 
@@ -623,7 +631,7 @@ class Fighter(sim.character.Character):
         self,
         level: int,
         use_pam: bool = False,
-        subclass_feats: List["sim.feat.Feat"] = [],
+        subclass_feats: Optional[List["sim.feat.Feat"]] = None,
         use_topple: bool = True,
         **kwargs
     ):
@@ -657,7 +665,8 @@ class Fighter(sim.character.Character):
         feats.append(SavageAttacker())
 
         # Add subclass feats
-        feats.extend(subclass_feats)
+        if subclass_feats:
+            feats.extend(subclass_feats)
         
         # Standard Fighter progression
         feats.extend(
@@ -681,7 +690,7 @@ class Fighter(sim.character.Character):
         super().__init__(
             name=self.name,
             level=level,
-            stats=[17, 10, 10, 10, 10, 10],  # Str-focused build
+            stats=(17, 10, 10, 10, 10, 10),  # Str-focused build
             base_feats=feats,
         )
 
@@ -852,6 +861,6 @@ class TWFFighter(sim.character.Character):
         super().__init__(
             name=self.name,
             level=level,
-            stats=[17, 10, 10, 10, 10, 10],  # Str-focused
+            stats=(17, 10, 10, 10, 10, 10),  # Str-focused
             base_feats=feats,
         )
@@ -13,7 +13,7 @@ FIXED ISSUES:
 
 from typing import List, Optional
 
-from util.util import get_magic_weapon, apply_asi_feats
+from util.util import get_magic_weapon, apply_asi_feats, at_level, level_table
 from feats.epic_boons import IrresistibleOffense
 from feats.origin import TavernBrawler
 from feats import ASI, Grappler
@@ -29,6 +29,9 @@ import sim.weapons
 # CONSTANTS & UTILITIES
 # ============================================================================
 
+_MARTIAL_ARTS_DIE = level_table({5: 8, 11: 10, 17: 12}, default=6)
+
+
 def martial_arts_die(level: int) -> int:
     """
     Get the martial arts die size for a given Monk level.
@@ -39,14 +42,7 @@ def martial_arts_die(level: int) -> int:
     Returns:
         Die size (6, 8, 10, or 12)
     """
-    if level >= 17:
-        return 12
-    elif level >= 11:
-        return 10
-    elif level >= 5:
-        return 8
-    else:
-        return 6
+    return at_level(_MARTIAL_ARTS_DIE, level)
 
 
 # ============================================================================
@@ -59,6 +55,8 @@ class MonkLevel(sim.core_feats.ClassLevels):
     
     Monks are martial artists who channel ki energy.
     """
+
+    __slots__ = ()
     
     def __init__(self, level: int):
         """
@@ -77,6 +75,8 @@ class Ki(sim.feat.Feat):
     You gain a pool of Ki Points equal to your Monk level.
     Ki recharges on short rest.
     """
+
+    __slots__ = ("max_ki",)
     
     def __init__(self, max_ki: int):
         """
@@ -106,6 +106,8 @@ class BodyAndMind(sim.feat.Feat):
     Increases Dexterity and Wisdom maximum and current values by 4.
     Represents the pinnacle of monastic training.
     """
+
+    __slots__ = ()
     
     def apply(self, character: "sim.character.Character") -> None:
         """
@@ -128,6 +130,8 @@ class FlurryOfBlows(sim.feat.Feat):
     Spend 1 Ki point to make two unarmed strikes as a bonus action.
     Gains a third attack at level 10.
     """
+
+    __slots__ = ("num_attacks", "weapon", "ki")
     
     def __init__(self, num_attacks: int, weapon: "sim.weapons.Weapon"):
         """
@@ -141,6 +145,16 @@ class FlurryOfBlows(sim.feat.Feat):
         self.num_attacks: int = num_attacks
         self.weapon: "sim.weapons.Weapon" = weapon
 
+    def apply(self, character: "sim.character.Character") -> None:
+        """
+        Keep a direct reference to the Ki pool.
+        
+        Args:
+            character: The character using Flurry of Blows
+        """
+        super().apply(character)
+        self.ki = character.resources['Ki']
+
     def before_action(self, target: "sim.target.Target") -> None:
         """
         Trigger Flurry of Blows before main action if Ki available.
@@ -148,10 +162,10 @@ class FlurryOfBlows(sim.feat.Feat):
         Args:
             target: Combat target
         """
-        if self.character.resources['Ki'].has() and self.character.use_bonus("FlurryOfBlows"):
-            self.character.resources['Ki'].use(detail="Flurry of Blows", target=target)
+        if self.ki.has() and self.character.use_bonus("FlurryOfBlows"):
+            self.ki.use(detail="Flurry of Blows", target=target)
             for _ in range(self.num_attacks):
-                self.character.weapon_attack(target, self.weapon, tags=["flurry"])
+                self.character.weapon_attack(target, self.weapon, tags=("flurry",))
         elif self.character.use_bonus("BonusAttack"):
             # Standard bonus unarmed strike if not using Flurry
             self.character.weapon_attack(target, self.weapon)
@@ -164,6 +178,8 @@ class StunningStrike(sim.feat.Feat):
     When you hit with a melee attack, spend 1 Ki to force a Constitution save.
     On failure, the target is stunned until the end of your next turn.
     """
+
+    __slots__ = ("weapon_die", "avoid_on_grapple", "used", "ki")
     
     def __init__(self, level: int, avoid_on_grapple: bool = False):
         """
@@ -175,10 +191,19 @@ class StunningStrike(sim.feat.Feat):
         """
         super().__init__()
         self.weapon_die: int = martial_arts_die(level)
-        self.stuns: List[int] = []
         self.avoid_on_grapple: bool = avoid_on_grapple
         self.used: bool = False
 
+    def apply(self, character: "sim.character.Character") -> None:
+        """
+        Keep a direct reference to the Ki pool.
+        
+        Args:
+            character: The character using Stunning Strike
+        """
+        super().apply(character)
+        self.ki = character.resources['Ki']
+
     def begin_turn(self, target: "sim.target.Target") -> None:
         """
         Reset usage and clear stun status.
@@ -199,7 +224,7 @@ class StunningStrike(sim.feat.Feat):
         target = args.attack.target
         
         # Don't use if conditions aren't met
-        if args.misses() or self.used or not self.character.resources['Ki'].has():
+        if args.misses() or self.used or not self.ki.has():
             return
         if target.grappled and self.avoid_on_grapple:
             return
@@ -208,7 +233,7 @@ class StunningStrike(sim.feat.Feat):
         
         # Attempt to stun
         self.used = True
-        self.character.resources['Ki'].use(detail="Stunning Strike", target=target)
+        self.ki.use(detail="Stunning Strike", target=target)
         
         if not target.save("con", self.character.dc("wis")):
             target.stunned = True
@@ -231,6 +256,8 @@ class OpenHandTechnique(sim.feat.Feat):
     
     For DPR purposes, we use the prone condition.
     """
+
+    __slots__ = ()
     
     def attack_result(self, args) -> None:
         """
@@ -367,6 +394,8 @@ class DefaultMonkAction(sim.feat.Feat):
     - Uses Flurry of Blows if Ki available
     - Falls back to bonus unarmed strike otherwise
     """
+
+    __slots__ = ("level", "weapon", "num_attacks", "has_flurry", "num_flurry", "ki")
     
     def __init__(self, level: int, weapon: "sim.weapons.Weapon"):
         """
@@ -379,6 +408,20 @@ class DefaultMonkAction(sim.feat.Feat):
         super().__init__()
         self.level: int = level
         self.weapon: "sim.weapons.Weapon" = weapon
+        # Attack counts only depend on the Monk level, so resolve them once
+        self.num_attacks: int = 2 if level >= 5 else 1
+        self.has_flurry: bool = level >= 2
+        self.num_flurry: int = 3 if level >= 10 else 2
+
+    def apply(self, character: "sim.character.Character") -> None:
+        """
+        Keep a direct reference to the Ki pool, if the Monk has one yet.
+        
+        Args:
+            character: The Monk taking this action
+        """
+        super().apply(character)
+        self.ki = character.resources.get('Ki')
 
     def action(self, target: "sim.target.Target") -> None:
         """
@@ -388,20 +431,18 @@ class DefaultMonkAction(sim.feat.Feat):
             target: Combat target
         """
         # Main attacks
-        num_attacks = 2 if self.character.has_class_level("Monk", 5) else 1
-        for _ in range(num_attacks):
-            self.character.weapon_attack(target, self.weapon, tags=["main_action"])
+        for _ in range(self.num_attacks):
+            self.character.weapon_attack(target, self.weapon, tags=("main_action",))
         
         # Flurry of Blows (bonus action)
         if (
-            self.character.has_class_level("Monk", 2)
-            and self.character.resources['Ki'].has()
+            self.has_flurry
+            and self.ki.has()
             and self.character.use_bonus("FlurryOfBlows")
         ):
-            self.character.resources['Ki'].use(detail="Flurry of Blows", target=target)
-            num_flurry = 3 if self.character.has_class_level("Monk", 10) else 2
-            for _ in range(num_flurry):
-                self.character.weapon_attack(target, self.weapon, tags=["flurry"])
+            self.ki.use(detail="Flurry of Blows", target=target)
+            for _ in range(self.num_flurry):
+                self.character.weapon_attack(target, self.weapon, tags=("flurry",))
         
         # Fallback bonus attack
         elif self.character.use_bonus("BonusAttack"):
@@ -475,6 +516,6 @@ class OpenHandMonk(sim.character.Character):
         super().__init__(
             name="Open Hand Monk",  # ✅ Explicit name
             level=level,
-            stats=[10, 17, 10, 10, 16, 10],  # Dex/Wis focused
+            stats=(10, 17, 10, 10, 16, 10),  # Dex/Wis focused
             base_feats=feats,
         )
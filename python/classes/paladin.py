@@ -47,10 +47,10 @@ class DevotionLevels(IntEnum):
 
 
 # Radiant Strikes damage dice
-RADIANT_STRIKES_DICE = [8]
+RADIANT_STRIKES_DICE = (8,)
 
 # Default ability scores for Paladin (Str and Cha focused)
-DEFAULT_PALADIN_STATS = [17, 10, 10, 10, 10, 16]
+DEFAULT_PALADIN_STATS = (17, 10, 10, 10, 10, 16)
 
 
 # ============================================================================
@@ -64,6 +64,8 @@ class PaladinLevel(sim.core_feats.ClassLevels):
     Paladins are half-casters, gaining spell slots more slowly than
     full spellcasters but faster than non-casters.
     """
+
+    __slots__ = ()
     
     def __init__(self, level: int):
         """
@@ -89,6 +91,8 @@ class DivineSmiteFeat(sim.feat.Feat):
     
     Strategy: Use highest available spell slot for maximum damage.
     """
+
+    __slots__ = ()
     
     def attack_result(self, args) -> None:
         """
@@ -97,8 +101,9 @@ class DivineSmiteFeat(sim.feat.Feat):
         Args:
             args: Attack result arguments
         """
-        # Only smite on hits
-        if args.misses():
+        # Only smite on hits, and only while the bonus action is free; this
+        # skips the slot scan for every later hit once the turn's smite is spent
+        if args.misses() or self.character.used_bonus:
             return
         
         # Check for available spell slots
@@ -121,6 +126,8 @@ class RadiantStrikes(sim.feat.Feat):
     
     This provides consistent extra damage without resource expenditure.
     """
+
+    __slots__ = ()
     
     def attack_result(self, args) -> None:
         """
@@ -144,6 +151,8 @@ class DivineFavorFeat(sim.feat.Feat):
     on another spell. Divine Favor adds 1d4 radiant damage to weapon
     attacks while concentrating.
     """
+
+    __slots__ = ()
     
     def begin_turn(self, target: "sim.target.Target") -> None:
         """
@@ -178,6 +187,8 @@ class SacredWeapon(sim.feat.Feat):
     
     Uses one Channel Divinity charge and recharges on short rest.
     """
+
+    __slots__ = ("enabled",)
     
     def __init__(self):
         """Initialize Sacred Weapon tracking."""
@@ -79,8 +79,7 @@ class BestialFury(sim.feat.Feat):
 class FoeSlayer(sim.feat.Feat):
     def damage_roll(self, args: DamageRollArgs):
         if args.damage.source == "HuntersMark":
-            for i in range(len(args.damage.dice)):
-                args.damage.dice[i] = 8
+            args.damage.dice = [8] * len(args.damage.dice)
             args.damage.reroll()
 
 
@@ -173,8 +172,8 @@ class GloomstalkerAction(sim.feat.Feat):
             return
         maybe_cast_hunters_mark(self.character, target)
         for weapon in self.attacks:
-            self.character.weapon_attack(target, weapon, tags=["main_action"])
-        self.character.weapon_attack(target, self.attacks[0], tags=["light"])
+            self.character.weapon_attack(target, weapon, tags=("main_action",))
+        self.character.weapon_attack(target, self.attacks[0], tags=("light",))
 
 
 class GloomstalkerRanger(sim.character.Character):
@@ -204,7 +203,7 @@ class GloomstalkerRanger(sim.character.Character):
         super().__init__(
             name=self.name,
             level=level,
-            stats=[10, 17, 10, 10, 16, 10],
+            stats=(10, 17, 10, 10, 16, 10),
             base_feats=feats,
             spell_mod="wis",
         )
@@ -224,7 +223,7 @@ class PrimalCompanion(sim.character.Character):
         super().__init__(
             name="Primal Companion",
             level=level,
-            stats=[10, 10, 10, 10, 10, 10],
+            stats=(10, 10, 10, 10, 10, 10),
             base_feats=feats,
         )
 
@@ -285,14 +284,14 @@ class BeastMasterAction(sim.feat.Feat):
                     commanded_beast = True
                 else:
                     self.character.weapon_attack(target, self.main_hand)
-            self.character.weapon_attack(target, self.shortsword, tags=["light"])
+            self.character.weapon_attack(target, self.shortsword, tags=("light",))
         else:
             self.character.weapon_attack(target, self.main_hand)
             # Use bonus action to use Vex weapon, if possible
             if self.character.use_bonus("light weapon"):
-                self.character.weapon_attack(target, self.scimitar, tags=["light"])
+                self.character.weapon_attack(target, self.scimitar, tags=("light",))
             else:
-                self.character.weapon_attack(target, self.shortsword, tags=["light"])
+                self.character.weapon_attack(target, self.shortsword, tags=("light",))
 
 
 def beast_master_ranger_feats(level: int) -> List["sim.feat.Feat"]:
@@ -335,7 +334,7 @@ class BeastMasterRanger(sim.character.Character):
         super().__init__(
             name=self.name,
             level=level,
-            stats=[10, 17, 10, 10, 16, 10],
+            stats=(10, 17, 10, 10, 16, 10),
             base_feats=feats,
             spell_mod="wis",
         )
@@ -5,6 +5,7 @@ from util.util import (
     apply_asi_feats,
     get_magic_weapon,
     do_roll,
+    cantrip_dice,
 )
 from feats.epic_boons import IrresistibleOffense
 from feats import ASI, AttackAction, WeaponMasteries
@@ -16,13 +17,18 @@ import sim.character
 
 
 class RogueLevel(sim.core_feats.ClassLevels):
+    __slots__ = ()
+
     def __init__(self, level: int):
         super().__init__(name="Rogue", level=level)
 
 
 class SneakAttack(sim.feat.Feat):
+    __slots__ = ("num", "dice", "used")
+
     def __init__(self, num):
         self.num = num
+        self.dice = num * (6,)
 
     def begin_turn(self, target):
         self.used = False
@@ -30,10 +36,12 @@ class SneakAttack(sim.feat.Feat):
     def attack_result(self, args):
         if args.hits() and not self.used:
             self.used = True
-            args.add_damage(source="SneakAttack", dice=self.num * [6])
+            args.add_damage(source="SneakAttack", dice=self.dice)
 
 
 class SteadyAim(sim.feat.Feat):
+    __slots__ = ("enabled",)
+
     def before_action(self, target):
         if self.character.use_bonus("SteadyAim"):
             self.enabled = True
@@ -48,6 +56,8 @@ class SteadyAim(sim.feat.Feat):
 
 
 class StrokeOfLuck(sim.feat.Feat):
+    __slots__ = ("used",)
+
     def begin_turn(self, target):
         self.used = False
 
@@ -59,16 +69,18 @@ class StrokeOfLuck(sim.feat.Feat):
 
 
 class Assassinate(sim.feat.Feat):
+    __slots__ = ("dmg", "adv", "resource")
+
     def __init__(self, dmg):
         self.dmg = dmg
         self.adv = False
 
     def apply(self, character: "sim.character.Character"):
         super().apply(character)
-        character.add_resource('Assassinate', max_uses=1, short_rest=True)
+        self.resource = character.add_resource('Assassinate', max_uses=1, short_rest=True)
 
     def begin_turn(self, target):
-        if self.character.resources['Assassinate'].has():
+        if self.resource.has():
              if do_roll(adv=True) + self.character.mod("dex") > do_roll():
                 self.adv = True
 
@@ -77,7 +89,7 @@ class Assassinate(sim.feat.Feat):
             args.adv = True
 
     def attack_result(self, args):
-        if args.hits() and self.character.resources['Assassinate'].use(detail="Assassinate", target=args.attack.target):
+        if args.hits() and self.resource.use(detail="Assassinate", target=args.attack.target):
             args.add_damage(source="Assassinate", damage=self.dmg)
 
     def end_turn(self, target):
@@ -85,40 +97,42 @@ class Assassinate(sim.feat.Feat):
 
 
 class DeathStrike(sim.feat.Feat):
+    __slots__ = ("resource",)
+
     def apply(self, character: "sim.character.Character"):
         super().apply(character)
-        character.add_resource('Death Strike', max_uses=1, short_rest=True)
+        self.resource = character.add_resource('Death Strike', max_uses=1, short_rest=True)
 
     def attack_result(self, args):
-        if args.hits() and self.character.resources['Death Strike'].use(detail="Death Strike", target=args.attack.target):
+        if args.hits() and self.resource.use(detail="Death Strike", target=args.attack.target):
             if not args.attack.target.save("dex", self.character.dc("dex")):
                 args.dmg_multiplier *= 2
 
 
 class BoomingBladeAction(sim.feat.Feat):
+    __slots__ = ("weapon", "dice")
+
     def __init__(
         self, character: "sim.character.Character", weapon: "sim.weapons.Weapon"
     ):
         self.weapon = weapon
         self.character = character
 
+    def apply(self, character):
+        super().apply(character)
+        # Extra d8s on hit: one fewer than the cantrip's dice count
+        self.dice = (cantrip_dice(character.level) - 1) * (8,)
+
     def action(self, target):
         self.character.weapon_attack(
-            target, self.weapon, tags=["main_action", "booming_blade"]
+            target, self.weapon, tags=("main_action", "booming_blade")
         )
 
     def attack_result(self, args):
         if args.misses() or not args.attack.has_tag("booming_blade"):
             return
-        if self.character.level >= 17:
-            extra_dice = 3
-        elif self.character.level >= 11:
-            extra_dice = 2
-        elif self.character.level >= 5:
-            extra_dice = 1
-        else:
-            return
-        args.add_damage(source="BoomingBlade", dice=extra_dice * [8])
+        if self.dice:
+            args.add_damage(source="BoomingBlade", dice=self.dice)
 
 
 def rogue_feats(
@@ -187,7 +201,7 @@ class AssassinRogue(sim.character.Character):
         super().__init__(
             name=self.name,
             level=level,
-            stats=[10, 17, 10, 10, 10, 10],
+            stats=(10, 17, 10, 10, 10, 10),
             base_feats=feats,
         )
 
@@ -221,6 +235,6 @@ class ArcaneTricksterRogue(sim.character.Character):
         super().__init__(
             name=self.name,
             level=level,
-            stats=[10, 17, 10, 10, 10, 10],
+            stats=(10, 17, 10, 10, 10, 10),
             base_feats=feats,
         )
@@ -7,10 +7,10 @@ Font of Magic (Sorcery Points), and the Draconic Bloodline subclass.
 COMPLETE SELF-CONTAINED VERSION - All spells included inline.
 """
 
-from typing import List, Literal, Optional
+from typing import List, Literal, Optional, Sequence, Tuple, Type
 from enum import IntEnum
 
-from util.util import apply_asi_feats, cantrip_dice
+from util.util import apply_asi_feats, cantrip_dice, at_level, level_table
 from sim.spells import (
     Spell,
     Spellcaster,
@@ -303,7 +303,18 @@ class DraconicLevels(IntEnum):
     ELEMENTAL_AFFINITY = 6
 
 
-DEFAULT_SORCERER_STATS = [10, 10, 14, 10, 10, 17]
+DEFAULT_SORCERER_STATS = (10, 10, 14, 10, 10, 17)
+
+_METAMAGIC_1: Tuple[Metamagic, ...] = ("Empowered", "Heightened")
+_METAMAGIC_2 = _METAMAGIC_1 + ("Quickened", "Twinned")
+_METAMAGIC_3 = _METAMAGIC_2 + ("Careful", "Extended")
+_METAMAGIC_CHOICES = level_table(
+    {
+        SorcererLevels.METAMAGIC_2: _METAMAGIC_2,
+        SorcererLevels.METAMAGIC_3: _METAMAGIC_3,
+    },
+    default=_METAMAGIC_1,
+)
 
 
 # ============================================================================
@@ -312,6 +323,8 @@ DEFAULT_SORCERER_STATS = [10, 10, 14, 10, 10, 17]
 
 class SorcererLevel(sim.core_feats.ClassLevels):
     """Sorcerer class levels and full spellcasting progression."""
+
+    __slots__ = ()
     
     def __init__(self, level: int):
         super().__init__(
@@ -323,6 +336,8 @@ class SorcererLevel(sim.core_feats.ClassLevels):
 
 class InnateSorcery(sim.feat.Feat):
     """Level 1 Sorcerer feature: Innate Sorcery."""
+
+    __slots__ = ("active", "duration")
     
     def __init__(self):
         super().__init__()
@@ -346,6 +361,8 @@ class InnateSorcery(sim.feat.Feat):
 
 class SorceryPointsResource(sim.feat.Feat):
     """Level 2 Sorcerer feature: Font of Magic."""
+
+    __slots__ = ("level",)
     
     def __init__(self, level: int):
         super().__init__()
@@ -358,14 +375,18 @@ class SorceryPointsResource(sim.feat.Feat):
 
 class Metamagics(sim.feat.Feat):
     """Level 2 Sorcerer feature: Metamagic."""
+
+    __slots__ = ("metamagics",)
     
-    def __init__(self, metamagics: List[Metamagic]):
+    def __init__(self, metamagics: Sequence[Metamagic]):
         super().__init__()
-        self.metamagics: List[Metamagic] = metamagics
+        self.metamagics: Sequence[Metamagic] = metamagics
 
 
 class SorcerousRestoration(sim.feat.Feat):
     """Level 5 Sorcerer feature: Sorcerous Restoration."""
+
+    __slots__ = ()
     
     POINTS_RESTORED = 4
     
@@ -379,6 +400,8 @@ class SorcerousRestoration(sim.feat.Feat):
 
 class ArcaneApotheosis(sim.feat.Feat):
     """Level 20 Sorcerer feature: Arcane Apotheosis."""
+
+    __slots__ = ()
     
     def __init__(self):
         super().__init__()
@@ -390,6 +413,8 @@ class ArcaneApotheosis(sim.feat.Feat):
 
 class DraconicResilience(sim.feat.Feat):
     """Draconic Bloodline Level 3 feature: Draconic Resilience."""
+
+    __slots__ = ()
     
     def __init__(self):
         super().__init__()
@@ -397,7 +422,13 @@ class DraconicResilience(sim.feat.Feat):
 
 class ElementalAffinity(sim.feat.Feat):
     """Draconic Bloodline Level 6 feature: Elemental Affinity."""
-    
+
+    __slots__ = ("used_this_spell",)
+
+    FIRE_SPELLS = frozenset(
+        ("FireBolt", "Fireball", "ScorchingRay", "DelayedBlastFireball", "MeteorSwarm")
+    )
+
     def __init__(self):
         super().__init__()
         self.used_this_spell: bool = False
@@ -409,10 +440,7 @@ class ElementalAffinity(sim.feat.Feat):
         if (
             args.spell
             and not self.used_this_spell
-            and args.spell.name in [
-                "FireBolt", "Fireball", "ScorchingRay", 
-                "DelayedBlastFireball", "MeteorSwarm"
-            ]
+            and args.spell.name in self.FIRE_SPELLS
         ):
             self.used_this_spell = True
             args.damage.flat_dmg += self.character.mod("cha")
@@ -422,39 +450,41 @@ class ElementalAffinity(sim.feat.Feat):
 # COMBAT ACTION
 # ============================================================================
 
+# Leveled spell cast from each slot level, indexed by slot (0 is the cantrip)
+_SPELL_BY_SLOT: Tuple[Optional[Type[Spell]], ...] = (
+    None,
+    ChromaticOrb,
+    ScorchingRay,
+    Fireball,
+    Blight,
+    ConeOfCold,
+    Disintegrate,
+    FingerOfDeath,
+    Sunburst,
+    MeteorSwarm,
+)
+
+
 class SorcererAction(sim.feat.Feat):
     """Automated Sorcerer spell selection for optimal DPR."""
-    
+
+    __slots__ = ("spell_by_slot",)
+
+    def apply(self, character: "sim.character.Character") -> None:
+        super().apply(character)
+        spell_by_slot = list(_SPELL_BY_SLOT)
+        if character.level >= 3:
+            spell_by_slot[1] = ChaosBolt
+        self.spell_by_slot = tuple(spell_by_slot)
+
     def action(self, target: "sim.target.Target") -> None:
         slot = self.character.spells.highest_slot()
-        spell: Optional["sim.spells.Spell"] = None
-        
-        if slot >= 9:
-            spell = MeteorSwarm(slot)
-        elif slot >= 8:
-            spell = Sunburst(slot)
-        elif slot >= 7:
-            spell = FingerOfDeath(slot)
-        elif slot >= 6:
-            spell = Disintegrate(slot)
-        elif slot >= 5:
-            spell = ConeOfCold(slot)
-        elif slot >= 4:
-            spell = Blight(slot)
-        elif slot >= 3:
-            spell = Fireball(slot)
-        elif slot >= 2:
-            spell = ScorchingRay(slot)
-        elif slot >= 1:
-            if self.character.level >= 3:
-                spell = ChaosBolt(slot)
-            else:
-                spell = ChromaticOrb(slot)
+        spell: "sim.spells.Spell"
+        if slot >= 1:
+            spell = self.spell_by_slot[slot](slot)
         else:
             spell = FireBolt()
-        
-        if spell is not None:
-            self.character.spells.cast(spell, target)
+        self.character.spells.cast(spell, target)
 
 
 # ============================================================================
@@ -463,7 +493,7 @@ class SorcererAction(sim.feat.Feat):
 
 def sorcerer_feats(
     level: int,
-    metamagics: List[Metamagic],
+    metamagics: Sequence[Metamagic],
     asis: Optional[List["sim.feat.Feat"]] = None
 ) -> List["sim.feat.Feat"]:
     """Build the standard Sorcerer feat list for a given level."""
@@ -526,16 +556,10 @@ class DraconicSorcerer(sim.character.Character):
         feats.append(SorcererAction())
         
         # Build Sorcerer progression
-        metamagic_choices: List[Metamagic] = ["Empowered", "Heightened"]
-        if level >= SorcererLevels.METAMAGIC_2:
-            metamagic_choices.extend(["Quickened", "Twinned"])
-        if level >= SorcererLevels.METAMAGIC_3:
-            metamagic_choices.extend(["Careful", "Extended"])
-        
         feats.extend(
             sorcerer_feats(
                 level,
-                metamagics=metamagic_choices,
+                metamagics=at_level(_METAMAGIC_CHOICES, level),
                 asis=[
                     ASI(["cha"]),
                     ASI(["cha"]),
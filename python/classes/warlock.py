@@ -11,7 +11,7 @@ FIXED ISSUES:
 - Correct resource management
 """
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from feats import ASI
 from sim.character import Character
@@ -26,6 +26,18 @@ import sim.core_feats
 import sim.feat
 
 
+# Levels at which Warlocks learn a new Eldritch Invocation
+WARLOCK_INVOCATION_LEVELS = (1, 2, 2, 5, 5, 7, 9, 12, 15, 18)
+
+# Mystic Arcanum spells gained at levels 11, 13, 15 and 17
+DEFAULT_ARCANUMS = (
+    "SummonFiend",      # 6th level
+    "FingerOfDeath",    # 7th level
+    "Befuddlement",     # 8th level
+    "PowerWordKill",    # 9th level
+)
+
+
 # ============================================================================
 # CORE WARLOCK FEATURES
 # ============================================================================
@@ -37,6 +49,8 @@ class WarlockLevel(sim.core_feats.ClassLevels):
     Warlocks use Pact Magic instead of standard Spellcasting.
     They have fewer spell slots that recharge on short rest.
     """
+
+    __slots__ = ()
     
     def __init__(self, level: int):
         """
@@ -67,6 +81,8 @@ class MysticArcanum(sim.feat.Feat):
     
     This represents mastery over specific high-level magic.
     """
+
+    __slots__ = ("spell_name", "resource")
     
     def __init__(self, spell_name: str):
         """
@@ -86,7 +102,7 @@ class MysticArcanum(sim.feat.Feat):
             character: The character to apply this to
         """
         super().apply(character)
-        character.add_resource(self.spell_name, max_uses=1, short_rest=False)
+        self.resource = character.add_resource(self.spell_name, max_uses=1, short_rest=False)
 
 
 # ============================================================================
@@ -100,6 +116,8 @@ class AgonizingBlast(sim.feat.Feat):
     Add your Charisma modifier to Eldritch Blast damage.
     This dramatically increases the damage of your signature cantrip.
     """
+
+    __slots__ = ()
     
     def attack_result(self, args: AttackResultArgs) -> None:
         """
@@ -127,7 +145,7 @@ def warlock_feats(
     level: int,
     invocations: Optional[list["sim.feat.Feat"]] = None,
     asis: Optional[list["sim.feat.Feat"]] = None,
-    arcanums: Optional[list[str]] = None,
+    arcanums: Optional[Sequence[str]] = None,
 ) -> list["sim.feat.Feat"]:
     """
     Build the standard Warlock feat list for a given level.
@@ -152,12 +170,7 @@ def warlock_feats(
     
     # Mystic Arcanum at levels 11, 13, 15, 17
     if arcanums is None:
-        arcanums = [
-            "SummonFiend",      # 6th level (gained at 11)
-            "FingerOfDeath",    # 7th level (gained at 13)
-            "Befuddlement",     # 8th level (gained at 15)
-            "PowerWordKill",    # 9th level (gained at 17)
-        ]
+        arcanums = DEFAULT_ARCANUMS
     
     if level >= 11:
         feats.append(MysticArcanum(arcanums[0]))
@@ -174,12 +187,11 @@ def warlock_feats(
     apply_asi_feats(level, feats, asis)
     
     # Apply Invocations at appropriate levels
-    # Warlocks gain invocations at levels: 1, 2, 2, 5, 5, 7, 9, 12, 15, 18
     if invocations:
         apply_feats_at_levels(
             level,
             feats,
-            schedule=[1, 2, 2, 5, 5, 7, 9, 12, 15, 18],
+            schedule=WARLOCK_INVOCATION_LEVELS,
             new_feats=invocations,
         )
     
@@ -222,7 +234,23 @@ class FiendWarlockAction(sim.feat.Feat):
     5. Fireball for mid-level damage
     6. Eldritch Blast as fallback
     """
-    
+
+    __slots__ = ("summon_fiend", "finger_of_death")
+
+    def apply(self, character: Character) -> None:
+        """
+        Keep direct references to the Mystic Arcanum resources.
+
+        The arcanum feats are applied before this action, so their
+        resources already exist (or are missing below level 11/13).
+
+        Args:
+            character: The character to apply this to
+        """
+        super().apply(character)
+        self.summon_fiend = character.resources.get("SummonFiend")
+        self.finger_of_death = character.resources.get("FingerOfDeath")
+
     def action(self, target: Target) -> None:
         """
         Choose and cast the optimal spell for the current situation.
@@ -231,11 +259,13 @@ class FiendWarlockAction(sim.feat.Feat):
             target: The target to attack/affect
         """
         # Check for Mystic Arcanum: Summon Fiend (6th level)
+        summon_fiend = self.summon_fiend
         if (
-            self.character.has_resource("SummonFiend")
+            summon_fiend is not None
+            and summon_fiend.has()
             and not self.character.spells.is_concentrating()
         ):
-            self.character.resources["SummonFiend"].use(detail="Mystic Arcanum: Summon Fiend", target=target)
+            summon_fiend.use(detail="Mystic Arcanum: Summon Fiend", target=target)
             self.character.spells.cast(
                 SummonFiend(slot=6),
                 target=target,
@@ -244,8 +274,9 @@ class FiendWarlockAction(sim.feat.Feat):
             return
         
         # Check for Mystic Arcanum: Finger of Death (7th level)
-        if self.character.has_resource("FingerOfDeath"):
-            self.character.resources["FingerOfDeath"].use(detail="Mystic Arcanum: Finger of Death", target=target)
+        finger_of_death = self.finger_of_death
+        if finger_of_death is not None and finger_of_death.has():
+            finger_of_death.use(detail="Mystic Arcanum: Finger of Death", target=target)
             self.character.spells.cast(
                 FingerOfDeath(slot=7),
                 target=target,
@@ -341,7 +372,7 @@ class FiendWarlock(sim.character.Character):
         super().__init__(
             name="Fiend Warlock",  # ✅ Explicit name
             level=level,
-            stats=[10, 10, 10, 10, 10, 17],  # Cha-focused
+            stats=(10, 10, 10, 10, 10, 17),  # Cha-focused
             base_feats=feats,
             spell_mod="cha",  # Charisma-based spellcasting
             ac=13,  # Base AC (could wear light armor)
@@ -384,7 +415,7 @@ class ArchfeyWarlock(sim.character.Character):
         super().__init__(
             name="Archfey Warlock",
             level=level,
-            stats=[10, 10, 10, 10, 10, 17],
+            stats=(10, 10, 10, 10, 10, 17),
             base_feats=feats,
             spell_mod="cha",
             ac=13,
@@ -421,7 +452,7 @@ class GreatOldOneWarlock(sim.character.Character):
         super().__init__(
             name="Great Old One Warlock",
             level=level,
-            stats=[10, 10, 10, 10, 10, 17],
+            stats=(10, 10, 10, 10, 10, 17),
             base_feats=feats,
             spell_mod="cha",
             ac=13,
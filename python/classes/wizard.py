@@ -162,7 +162,7 @@ class EvocationWizard(sim.character.Character):
         super().__init__(
             name=self.name,
             level=level,
-            stats=[10, 10, 10, 17, 10, 10],
+            stats=(10, 10, 10, 17, 10, 10),
             base_feats=feats,
             spell_mod="int",
         )
@@ -9,6 +9,19 @@ from ui_utils import display_hp_bar, print_section_header
 
 class CombatDisplay:
     """Maneja toda la visualización del combate"""
+
+    # (atributo de la entidad, etiqueta mostrada)
+    CONDITION_LABELS = (
+        ('prone', "Derribado"),
+        ('grappled', "Agarrado"),
+        ('stunned', "Aturdido"),
+        ('poisoned', "Envenenado"),
+    )
+    DAMAGE_TRAIT_LABELS = (
+        ('resistances', "Resistencias"),
+        ('vulnerabilities', "Vulnerabilidades"),
+        ('immunities', "Inmunidades"),
+    )
     
     @staticmethod
     def show_combat_state(combat, round_number):
@@ -110,15 +123,10 @@ class CombatDisplay:
                 print(f"  {stat_name.upper()}: {stat_value} ({sign}{modifier})")
         
         # Condiciones
-        conditions = []
-        if hasattr(entity, 'prone') and entity.prone:
-            conditions.append("Derribado")
-        if hasattr(entity, 'grappled') and entity.grappled:
-            conditions.append("Agarrado")
-        if hasattr(entity, 'stunned') and entity.stunned:
-            conditions.append("Aturdido")
-        if hasattr(entity, 'poisoned') and entity.poisoned:
-            conditions.append("Envenenado")
+        conditions = [
+            label for attr, label in CombatDisplay.CONDITION_LABELS
+            if getattr(entity, attr, False)
+        ]
         
         if conditions:
             print(f"\n{Colors.BOLD}Condiciones:{Colors.ENDC} {', '.join(conditions)}")
@@ -126,12 +134,10 @@ class CombatDisplay:
             print(f"\n{Colors.BOLD}Condiciones:{Colors.ENDC} Ninguna")
         
         # Resistencias, vulnerabilidades, inmunidades (si es monstruo)
-        if hasattr(entity, 'resistances') and entity.resistances:
-            print(f"\n{Colors.BOLD}Resistencias:{Colors.ENDC} {', '.join(entity.resistances)}")
-        if hasattr(entity, 'vulnerabilities') and entity.vulnerabilities:
-            print(f"\n{Colors.BOLD}Vulnerabilidades:{Colors.ENDC} {', '.join(entity.vulnerabilities)}")
-        if hasattr(entity, 'immunities') and entity.immunities:
-            print(f"\n{Colors.BOLD}Inmunidades:{Colors.ENDC} {', '.join(entity.immunities)}")
+        for attr, label in CombatDisplay.DAMAGE_TRAIT_LABELS:
+            values = getattr(entity, attr, None)
+            if values:
+                print(f"\n{Colors.BOLD}{label}:{Colors.ENDC} {', '.join(values)}")
         
         print(f"\n{Colors.BOLD}{Colors.OKCYAN}{'═' * 70}{Colors.ENDC}")
     
@@ -187,11 +193,20 @@ class CombatDisplay:
         print_section_header("RESUMEN DE COMBATES", "📊")
         
         total_combats = len(results)
-        party_wins = sum(1 for r in results if r.get('winner') == 'party')
-        enemy_wins = sum(1 for r in results if r.get('winner') in ['enemies', 'monsters'])
+        party_wins = 0
+        enemy_wins = 0
+        total_rounds = 0
+        # Una sola pasada sobre los resultados
+        for r in results:
+            winner = r.get('winner')
+            if winner == 'party':
+                party_wins += 1
+            elif winner == 'enemies' or winner == 'monsters':
+                enemy_wins += 1
+            total_rounds += r.get('rounds', 0)
         draws = total_combats - party_wins - enemy_wins
         
-        avg_rounds = sum(r.get('rounds', 0) for r in results) / total_combats if total_combats > 0 else 0
+        avg_rounds = total_rounds / total_combats
         
         print(f"Total de combates: {Colors.BOLD}{total_combats}{Colors.ENDC}")
         print(f"Victorias del party: {Colors.OKGREEN}{party_wins}{Colors.ENDC} ({party_wins/total_combats*100:.1f}%)")
@@ -14,12 +14,21 @@ from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from colors import Colors
 from constants import CUSTOM_CHARS_DIR
+from sim.character_config import CharacterConfig
 from simulator_exceptions import CharacterLoadException, MonsterLoadException
 
 if TYPE_CHECKING:
     from types import ModuleType
 
 
+# Custom character configs by (file path, character key), with the file's
+# mtime when it was read. Reusing the config skips re-reading and
+# re-validating the JSON on every combat. The cache is process-wide because
+# the web app creates a new CombatManager for every request; the mtime check
+# keeps it in step with edits to the files.
+_custom_configs: Dict[Tuple[str, str], Tuple[float, CharacterConfig]] = {}
+
+
 @dataclass
 class CombatConfig:
     """
@@ -223,6 +232,12 @@ class CombatManager:
             CharacterLoadException: If the file cannot be parsed or character created
         """
         try:
+            mtime = os.path.getmtime(file_path)
+            cache_key = (file_path, char_key)
+            cached = _custom_configs.get(cache_key)
+            if cached is not None and cached[0] == mtime:
+                return cached[1].create(level)
+            
             with open(file_path, 'r', encoding='utf-8') as f:
                 char_data = json.load(f)
             
@@ -242,7 +257,12 @@ class CombatManager:
             
             # Create character with custom args
             args = char_data.get('args', {})
-            return constructor(level=level, **args)
+            # Keep the constructor's default name for characters without one,
+            # as before, rather than renaming them to char_key
+            config = CharacterConfig("Unnamed Character", constructor, **args)
+            character = config.create(level)
+            _custom_configs[cache_key] = (mtime, config)
+            return character
             
         except json.JSONDecodeError as e:
             raise CharacterLoadException(
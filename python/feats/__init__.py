@@ -1,4 +1,4 @@
-from typing import List, Literal
+from typing import List, Literal, Optional, Tuple
 
 from util.util import roll_dice
 
@@ -79,8 +79,8 @@ class CrossbowExpert(sim.feat.Feat):
 
 
 class ASI(sim.feat.Feat):
-    def __init__(self, stat_increases: List["sim.Stat"] = []):
-        self.stat_increases = stat_increases
+    def __init__(self, stat_increases: Optional[List["sim.Stat"]] = None):
+        self.stat_increases = stat_increases or []
 
     def apply(self, character: "sim.character.Character"):
         super().apply(character)
@@ -90,15 +90,23 @@ class ASI(sim.feat.Feat):
 
 
 class AttackAction(sim.feat.Feat):
-    def __init__(self, attacks, nick_attacks=[]):
-        self.base_attacks = attacks
-        self.nick_attacks = nick_attacks
+    def __init__(self, attacks, nick_attacks=None):
+        # attacks may hold weapons or (weapon, count) pairs; consecutive
+        # attacks with the same weapon are stored as a single pair
+        self.base_attacks: List[Tuple["sim.weapons.Weapon", int]] = []
+        for attack in attacks:
+            weapon, count = attack if isinstance(attack, tuple) else (attack, 1)
+            if self.base_attacks and self.base_attacks[-1][0] is weapon:
+                count += self.base_attacks.pop()[1]
+            self.base_attacks.append((weapon, count))
+        self.nick_attacks = nick_attacks or []
 
     def action(self, target):
-        for weapon in self.base_attacks:
-            self.character.weapon_attack(target, weapon, tags=["main_action"])
+        for weapon, count in self.base_attacks:
+            for _ in range(count):
+                self.character.weapon_attack(target, weapon, tags=("main_action",))
         for weapon in self.nick_attacks:
-            self.character.weapon_attack(target, weapon, tags=["main_action", "light"])
+            self.character.weapon_attack(target, weapon, tags=("main_action", "light"))
 
 
 class LightWeaponBonusAttack(sim.feat.Feat):
@@ -115,7 +123,7 @@ class LightWeaponBonusAttack(sim.feat.Feat):
 
     def end_turn(self, target):
         if self.enabled and self.character.use_bonus("LightWeaponBonusAttack"):
-            self.character.weapon_attack(target, self.weapon, tags=["light"])
+            self.character.weapon_attack(target, self.weapon, tags=("light",))
 
 
 class WeaponMasteries(sim.feat.Feat):
@@ -153,7 +161,7 @@ class DualWielder(sim.feat.Feat):
 
     def after_action(self, target):
         if self.character.use_bonus("DualWielder"):
-            self.character.weapon_attack(target, self.weapon, tags=["light"])
+            self.character.weapon_attack(target, self.weapon, tags=("light",))
 
 
 class Piercer(sim.feat.Feat):
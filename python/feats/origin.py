@@ -1,4 +1,4 @@
-from util.util import roll_dice
+from util.util import roll_dice, roll_each
 
 import sim.feat
 
@@ -14,7 +14,7 @@ class SavageAttacker(sim.feat.Feat):
         if self.used or not args.attack.weapon:
             return
         self.used = True
-        new_rolls = [roll_dice(1, die) for die in args.damage.dice]
+        new_rolls = roll_each(args.damage.dice)
         if sum(new_rolls) > sum(args.damage.rolls):
             args.damage.rolls = new_rolls
 
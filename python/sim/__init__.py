@@ -10,7 +10,10 @@ against various targets and monsters. It handles:
 """
 
 from typing import Callable, Any, Union, Literal, Tuple, List, Optional, TYPE_CHECKING
+from collections import Counter
+import os
 import random
+import multiprocessing
 import multiprocessing.pool
 
 if TYPE_CHECKING:
@@ -20,6 +23,7 @@ if TYPE_CHECKING:
 from sim.monster import BaseMonster
 from .character_config import CharacterConfig
 from util.log import log
+from util.util import reset_dice
 
 
 # ============================================================================
@@ -49,6 +53,9 @@ DEFAULT_ROUNDS_PER_FIGHT = 5
 DEFAULT_FIGHTS_PER_REST = 3
 DEFAULT_ITERATIONS = 500
 
+# Environment variable holding a base seed for reproducible DPR runs
+SEED_ENV_VAR = "DND_SEED"
+
 
 # ============================================================================
 # SIMULATION CLASSES
@@ -320,6 +327,49 @@ def _run_single_dpr_iteration(
     simulation.run()
     return simulation.get_total_damage()
 
+
+def _run_dpr_batch(
+    character: "sim.character.Character",
+    level: int,
+    num_fights: int,
+    num_rounds: int,
+    monster_name: str,
+    batch_size: int,
+    seed: Optional[int] = None,
+) -> float:
+    """Helper function to run a batch of DPR iterations and sum their damage."""
+    if seed is not None:
+        random.seed(seed)
+        reset_dice()
+    total_damage = 0
+    for _ in range(batch_size):
+        total_damage += _run_single_dpr_iteration(
+            character, level, num_fights, num_rounds, monster_name
+        )
+    return total_damage
+
+
+def _split_iterations(iterations: int, num_batches: int) -> List[int]:
+    """Split iterations into num_batches sizes that differ by at most one."""
+    base, extra = divmod(iterations, num_batches)
+    return [base + 1 if i < extra else base for i in range(num_batches)]
+
+
+def _batch_seeds(level: int, num_batches: int) -> List[Optional[int]]:
+    """
+    Derive one independent seed per batch from the DND_SEED environment variable.
+
+    Seeds are derived once per call instead of reseeding per iteration, and
+    depend only on the base seed, level and batch index so that a run can be
+    replayed. Returns None for every batch when DND_SEED is unset.
+    """
+    base_seed = os.environ.get(SEED_ENV_VAR)
+    if base_seed is None:
+        return [None] * num_batches
+    seeder = random.Random(f"{base_seed}:{level}")
+    return [seeder.getrandbits(64) for _ in range(num_batches)]
+
+
 def test_dpr(
     character: "sim.character.Character",
     level: int,
@@ -350,20 +400,35 @@ def test_dpr(
         
     Raises:
         ValueError: If parameters are invalid
+
+    Reproducibility:
+        Set the DND_SEED environment variable to seed each worker batch with
+        its own derived stream. Results repeat for the same seed and CPU count.
     """
     if iterations < 1:
         raise ValueError(f"iterations must be positive, got {iterations}")
     
-    # Create arguments for each iteration
-    args_for_pool = [
-        (character, level, num_fights, num_rounds, monster_name)
-        for _ in range(iterations)
-    ]
-    
-    with multiprocessing.pool.Pool() as pool:
-        results = pool.starmap(_run_single_dpr_iteration, args_for_pool)
-    
-    total_damage = sum(results)
+    # Pool workers are daemonic and cannot start a pool of their own, so
+    # nested calls (e.g. from test_character) run the whole batch inline
+    if multiprocessing.current_process().daemon:
+        total_damage = _run_dpr_batch(
+            character, level, num_fights, num_rounds, monster_name, iterations,
+            _batch_seeds(level, 1)[0],
+        )
+    else:
+        # One contiguous batch per worker: the character is pickled once per
+        # batch instead of once per iteration
+        num_batches = min(iterations, os.cpu_count() or 1)
+        args_for_pool = [
+            (character, level, num_fights, num_rounds, monster_name, batch_size, seed)
+            for batch_size, seed in zip(
+                _split_iterations(iterations, num_batches),
+                _batch_seeds(level, num_batches),
+            )
+        ]
+
+        with multiprocessing.pool.Pool(num_batches) as pool:
+            total_damage = sum(pool.starmap(_run_dpr_batch, args_for_pool))
     
     # Calculate average DPR
     total_rounds = num_fights * num_rounds * iterations
@@ -435,7 +500,7 @@ def test_characters(
     iterations: int = DEFAULT_ITERATIONS,
     debug: bool = False,
     monster_name: str = DEFAULT_MONSTER,
-) -> Tuple[List[List[Any]], Optional[defaultdict]]:
+) -> Tuple[List[List[Any]], Optional[Counter]]:
     """
     Test multiple characters in parallel across a level range.
     
@@ -455,7 +520,7 @@ def test_characters(
     Returns:
         A tuple containing:
         - List of results in format: [["Level", "Character", "DPR"], [level, name, dpr], ...]
-        - Aggregated log data (defaultdict) if debug is True, otherwise None
+        - Aggregated log data (Counter) if debug is True, otherwise None
         
     Raises:
         ValueError: If parameters are invalid
@@ -469,7 +534,7 @@ def test_characters(
     
     # Initialize with header row (without "Log" column)
     dpr_results = [["Level", "Character", "DPR"]]
-    all_log_data = defaultdict(int)
+    all_log_data = Counter()
     
     # Temporarily save current global log state and clear for this run
     initial_log_enabled = log.enabled
@@ -498,20 +563,20 @@ def test_characters(
     ]
     
     # Run tests in parallel using multiprocessing
-    with multiprocessing.pool.Pool() as pool:
-        # Each output will be a dictionary: {"character_name": ..., "data": [[level, name, dpr], ...], "log_data": {}}
-        outputs = pool.map(test_character, args_list)
-        
-        # Aggregate results and log data
-        for output in outputs:
-            dpr_results.extend(output["data"])
-            if debug: # Only aggregate log data if debug is enabled
-                for key, value in output["log_data"].items():
-                    all_log_data[key] += value
-    
-    # Restore initial global log state
-    log.enabled = initial_log_enabled
-    log.record_ = initial_log_record
+    try:
+        with multiprocessing.pool.Pool() as pool:
+            # Each output will be a dictionary: {"character_name": ..., "data": [[level, name, dpr], ...], "log_data": {}}
+            outputs = pool.map(test_character, args_list)
+            
+            # Aggregate results and log data
+            for output in outputs:
+                dpr_results.extend(output["data"])
+                if debug: # Only aggregate log data if debug is enabled
+                    all_log_data.update(output["log_data"])
+    finally:
+        # Restore initial global log state, even if a character failed
+        log.enabled = initial_log_enabled
+        log.record_ = initial_log_record
     
     if debug:
         return dpr_results, all_log_data
@@ -547,4 +612,5 @@ __all__ = [
     "DEFAULT_FIGHTS_PER_REST",
     "DEFAULT_ITERATIONS",
     "MAX_ITERATIONS",
+    "SEED_ENV_VAR",
 ]
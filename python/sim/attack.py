@@ -3,10 +3,10 @@ Combat attack system for D&D 5e simulation.
 
 This module handles damage rolls, attack types (weapon/spell), and attack resolution.
 """
-from typing import Optional, Protocol, Self, Callable, Any, TYPE_CHECKING
+from typing import Optional, Protocol, Self, Sequence, Callable, Any, TYPE_CHECKING
 from dataclasses import dataclass, field
 
-from util.util import roll_dice
+from util.util import roll_each
 from sim.events import AttackResultArgs
 
 if TYPE_CHECKING:
@@ -21,13 +21,13 @@ class DamageRoll:
     
     Attributes:
         source: Name of the damage source (weapon, spell, etc.)
-        dice: List of die sizes to roll (e.g., [6, 6] for 2d6)
+        dice: Sequence of die sizes to roll (e.g., [6, 6] for 2d6)
         flat_dmg: Flat damage modifier to add
         damage_type: Type of damage (physical, fire, cold, etc.)
         rolls: Actual dice roll results
     """
     source: str = "Unknown"
-    dice: list[int] = field(default_factory=list)
+    dice: Sequence[int] = field(default_factory=list)
     flat_dmg: int = 0
     damage_type: str = "physical"
     rolls: list[int] = field(default_factory=list, init=False)
@@ -35,7 +35,7 @@ class DamageRoll:
     def __post_init__(self):
         """Initialize dice rolls after dataclass creation."""
         if not self.rolls:
-            self.rolls = [roll_dice(1, die) for die in self.dice]
+            self.rolls = roll_each(self.dice)
     
     @classmethod
     def from_dice_notation(
@@ -73,12 +73,12 @@ class DamageRoll:
 
     def reroll(self) -> None:
         """Reroll all dice (e.g., for reroll mechanics)."""
-        self.rolls = [roll_dice(1, die) for die in self.dice]
+        self.rolls = roll_each(self.dice)
     
     def double_dice(self) -> None:
         """Double the number of dice (for critical hits)."""
         self.dice = self.dice * 2
-        self.rolls = [roll_dice(1, die) for die in self.dice]
+        self.rolls = roll_each(self.dice)
 
 
 class CharacterProtocol(Protocol):
@@ -4,7 +4,7 @@ Character class for D&D 5e combat simulation.
 This module implements the core Character class with stats, abilities,
 spellcasting, feats, resources, and combat mechanics.
 """
-from typing import Dict, List, Optional, Set, TYPE_CHECKING
+from typing import Dict, List, Optional, Sequence, Set, TYPE_CHECKING
 from collections import defaultdict # Added for resource tracking
 from dataclasses import dataclass
 import math
@@ -13,7 +13,7 @@ import sim.bardic_inspiration
 import sim.maneuvers
 from util.util import prof_bonus
 from sim.core_feats import Vex, Topple, Graze
-from sim.events import AttackRollArgs, AttackArgs, AttackResultArgs
+from sim.events import AttackRollArgs, AttackArgs, AttackResultArgs, DamageRollArgs
 from sim.event_loop import EventLoop
 from util.log import log
 from sim.spells import Spellcasting, Spellcaster
@@ -61,6 +61,33 @@ class CharacterStats:
         }
 
 
+class AbilityScores(dict):
+    """
+    Ability scores by name that keep their modifiers up to date.
+    
+    Character.mod() is called for nearly every attack and damage roll, so
+    the modifiers are recomputed on assignment instead of on every read.
+    Item assignment is the only supported way to change a score.
+    
+    Attributes:
+        mods: Ability modifier for each score
+    """
+    
+    def __init__(self, scores: Dict[str, int]) -> None:
+        super().__init__(scores)
+        self.mods: Dict[str, int] = {
+            stat: (value - 10) // 2 for stat, value in scores.items()
+        }
+    
+    def __setitem__(self, stat: str, value: int) -> None:
+        super().__setitem__(stat, value)
+        self.mods[stat] = (value - 10) // 2
+    
+    def __reduce__(self):
+        # Rebuild through __init__ so unpickled copies get their modifiers
+        return (AbilityScores, (dict(self),))
+
+
 class Character:
     """
     Represents a D&D 5e character with combat capabilities.
@@ -82,11 +109,15 @@ class Character:
         feats: List of character feats
         resources: Custom resources (Ki, Channel Divinity, etc.)
     """
+
+    # Every character carries a Spellcasting system (see __init__), so
+    # callers can test this class flag instead of probing for `spells`
+    HAS_SPELLS: bool = True
     
     def __init__(
         self,
         level: int,
-        stats: List[int],
+        stats: Sequence[int],
         base_feats: Optional[List["sim.feat.Feat"]] = None,
         spellcaster: Spellcaster = Spellcaster.NONE,
         spell_mod: str = "none",
@@ -98,7 +129,7 @@ class Character:
         
         Args:
             level: Character level (1-20)
-            stats: List of 6 ability scores [STR, DEX, CON, INT, WIS, CHA]
+            stats: Sequence of 6 ability scores [STR, DEX, CON, INT, WIS, CHA]
             base_feats: Initial feats to apply
             spellcaster: Spellcaster type
             spell_mod: Spellcasting ability modifier
@@ -122,14 +153,14 @@ class Character:
         self.prof = prof_bonus(level)
         
         # Ability scores
-        self.stats = {
+        self.stats = AbilityScores({
             "str": stats[0],
             "dex": stats[1],
             "con": stats[2],
             "int": stats[3],
             "wis": stats[4],
             "cha": stats[5],
-        }
+        })
         self.stat_max = {stat: DEFAULT_STAT_MAX for stat in STATS}
         
         # Combat stats
@@ -141,6 +172,9 @@ class Character:
         self.actions = 1
         self.used_bonus = False
         self.current_round = 0
+        # Incremented at each begin_turn; once-per-turn feats compare
+        # against it instead of resetting a flag in their own begin_turn
+        self.turn_count = 0
         self.poisoned = False
         
         # Effects and minions
@@ -258,10 +292,7 @@ class Character:
         Returns:
             Ability modifier (0 if "none")
         """
-        if stat == "none":
-            return 0
-        stat_value = self.stats.get(stat, 10)
-        return (stat_value - 10) // 2
+        return self.stats.mods.get(stat, 0)
 
     def increase_stat_max(self, stat: str, amount: int) -> None:
         """
@@ -386,7 +417,9 @@ class Character:
     #       RESOURCES
     # =============================
 
-    def add_resource(self, name: str, max_uses: int, short_rest: bool = False, **kwargs) -> None:
+    def add_resource(
+        self, name: str, max_uses: int, short_rest: bool = False, **kwargs
+    ) -> "sim.resource.Resource":
         """
         Add a custom resource to character.
         
@@ -395,6 +428,9 @@ class Character:
             max_uses: Maximum number of uses
             short_rest: Whether resource recharges on short rest
             **kwargs: Additional arguments for specialized resource constructors
+            
+        Returns:
+            The new resource, so feats can keep a direct reference to it
         """
         if name == "Bardic Inspiration":
             resource = sim.bardic_inspiration.BardicInspiration(self, name, short_rest, kwargs.get('die_size', 6))
@@ -407,6 +443,7 @@ class Character:
             resource.increase_max(max_uses)
             resource.reset()
         self.resources[name] = resource
+        return resource
 
     def has_resource(self, name: str) -> bool:
         """
@@ -431,7 +468,8 @@ class Character:
             True if bonus action was available and used
         """
         if not self.used_bonus:
-            log.record(f"Bonus ({source})", 1)
+            if log.enabled:
+                log.record(f"Bonus ({source})", 1)
             self.used_bonus = True
             return True
         return False
@@ -475,6 +513,7 @@ class Character:
             combat: The combat instance for logging
         """
         self.current_round = round_number
+        self.turn_count += 1
         log.record("Turn", 1)
         self.actions = 1
         self.used_bonus = False
@@ -543,7 +582,7 @@ class Character:
         self,
         target: "sim.target.Target",
         weapon: "sim.weapons.Weapon",
-        tags: Optional[List[str]] = None,
+        tags: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Make a weapon attack.
@@ -588,7 +627,7 @@ class Character:
         attack: "sim.attack.Attack",
         weapon: Optional["sim.weapons.Weapon"] = None,
         spell: Optional["sim.spells.Spell"] = None,
-        tags: Optional[List[str]] = None,
+        tags: Optional[Sequence[str]] = None,
     ) -> None:
         """
         Execute a complete attack sequence.
@@ -610,7 +649,11 @@ class Character:
             tags=tags
         )
         
-        log.record(f"Attack ({args.attack.name})", 1)
+        # Logging is disabled during DPR sweeps; check once per attack so the
+        # record keys below are only formatted when they will be kept
+        logging = log.enabled
+        if logging:
+            log.record(f"Attack ({args.attack.name})", 1)
         self.events.emit("before_attack")
         
         # Roll to hit
@@ -618,13 +661,7 @@ class Character:
         roll_result = self.attack_roll(attack=args, to_hit=to_hit)
         roll = roll_result.roll()
         
-        # Determine crit threshold
-        min_crit = (
-            args.attack.min_crit()
-            if roll_result.min_crit is None
-            else roll_result.min_crit
-        )
-        crit = roll >= min_crit
+        crit = roll >= roll_result.min_crit
         
         # Calculate hit
         roll_total = roll + to_hit + roll_result.situational_bonus
@@ -639,13 +676,14 @@ class Character:
         )
         
         # Log result
-        if hit:
-            log.record(f"Hit ({args.attack.name})", 1)
-        else:
-            log.record(f"Miss ({args.attack.name})", 1)
-        
-        if crit:
-            log.record(f"Crit ({args.attack.name})", 1)
+        if logging:
+            if hit:
+                log.record(f"Hit ({args.attack.name})", 1)
+            else:
+                log.record(f"Miss ({args.attack.name})", 1)
+            
+            if crit:
+                log.record(f"Crit ({args.attack.name})", 1)
         
         # Apply attack effects
         args.attack.attack_result(result, self)
@@ -723,9 +761,7 @@ class Character:
             spell: Spell that caused damage
             multiplier: Damage multiplier
         """
-        import sim.events
-        
-        args = sim.events.DamageRollArgs(
+        args = DamageRollArgs(
             target=target,
             damage=damage,
             attack=attack,
@@ -738,7 +774,8 @@ class Character:
         # Calculate final damage
         total_damage = math.floor(args.damage.total() * multiplier)
         
-        log.record(f"Damage ({args.damage.source})", total_damage)
+        if log.enabled:
+            log.record(f"Damage ({args.damage.source})", total_damage)
         
         # Apply to target
         target.apply_damage(
@@ -0,0 +1,26 @@
+import sim.character
+import sim.character_config
+
+
+def sample_config():
+    def make_character(level):
+        return sim.character.Character(level=level, stats=[12, 12, 12, 12, 12, 12])
+
+    return sim.character_config.CharacterConfig("Sample", make_character)
+
+
+def test_create_sets_name():
+    character = sample_config().create(5)
+    assert character.name == "Sample"
+    assert character.level == 5
+
+
+def test_create_returns_independent_copies():
+    config = sample_config()
+    first = config.create(5)
+    second = config.create(5)
+    assert first is not second
+    assert first.feats[0] is not second.feats[0]
+    first.hp -= 10
+    assert second.hp == second.max_hp
+
@@ -139,6 +139,18 @@ class TestCharacterStats:
             assert actual_mod == expected_mod, \
                 f"Score {score} should give modifier {expected_mod}, got {actual_mod}"
     
+    def test_modifiers_survive_copy(self):
+        """Test that pickled copies keep modifiers in sync with their scores."""
+        import pickle
+        character = sim.test_helpers.sample_character()
+        character.increase_stat("dex", 2)
+        copy = pickle.loads(pickle.dumps(character))
+        
+        assert copy.mod("dex") == character.mod("dex")
+        copy.stats["dex"] = 8
+        assert copy.mod("dex") == -1
+        assert copy.mod("none") == 0
+    
     def test_increase_stat_max(self):
         """Test that increase_stat_max correctly increases the maximum allowed value for a stat."""
         character = sim.test_helpers.sample_character()
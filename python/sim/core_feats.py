@@ -22,6 +22,8 @@ class ClassLevels(sim.feat.Feat):
         level: Number of levels in this class
         spellcaster: Optional spellcaster type for spell slot progression
     """
+
+    __slots__ = ("class_name", "level", "spellcaster")
     
     def __init__(
         self,
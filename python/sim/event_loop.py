@@ -15,7 +15,8 @@ class Listener:
     Listeners should implement methods matching event names
     (e.g., 'attack_roll', 'damage_roll') to respond to events.
     """
-    pass
+    # Empty slots so that subclasses declaring __slots__ drop their __dict__
+    __slots__ = ()
 
 
 class EventLoop:
@@ -28,6 +29,8 @@ class EventLoop:
     
     Attributes:
         listeners: Dictionary mapping event names to lists of listeners
+        handlers: Dictionary mapping event names to the listeners' bound
+            handler methods, resolved once at registration
         
     Examples:
         >>> loop = EventLoop()
@@ -45,6 +48,7 @@ class EventLoop:
     def __init__(self) -> None:
         """Initialize empty event loop."""
         self.listeners: Dict[str, List[Listener]] = {}
+        self.handlers: Dict[str, List[Callable[..., Any]]] = {}
 
     def add(
         self,
@@ -70,10 +74,31 @@ class EventLoop:
         for event in events:
             if event not in self.listeners:
                 self.listeners[event] = []
+                self.handlers[event] = []
             
             # Avoid duplicate registrations
             if listener not in self.listeners[event]:
                 self.listeners[event].append(listener)
+                handler = getattr(listener, event, None)
+                if callable(handler):
+                    self.handlers[event].append(handler)
+
+    def _refresh_handlers(self, event: str) -> None:
+        """
+        Rebuild the bound handlers for an event after listeners were removed.
+        
+        A new list is built rather than mutating the old one, so an emit
+        that is in progress keeps iterating a consistent list.
+        
+        Args:
+            event: Event name to rebuild
+        """
+        handlers = []
+        for listener in self.listeners[event]:
+            handler = getattr(listener, event, None)
+            if callable(handler):
+                handlers.append(handler)
+        self.handlers[event] = handlers
 
     def remove(self, listener: Listener) -> None:
         """
@@ -85,6 +110,7 @@ class EventLoop:
         for event_name in self.listeners:
             if listener in self.listeners[event_name]:
                 self.listeners[event_name].remove(listener)
+                self._refresh_handlers(event_name)
 
     def remove_from_event(self, listener: Listener, event: str) -> None:
         """
@@ -96,13 +122,15 @@ class EventLoop:
         """
         if event in self.listeners and listener in self.listeners[event]:
             self.listeners[event].remove(listener)
+            self._refresh_handlers(event)
 
     def emit(self, event: str, *args, **kwargs) -> None:
         """
         Dispatch an event to all registered listeners.
         
         Calls the method named `event` on each listener that has such
-        a method, passing along any arguments.
+        a method, passing along any arguments. The bound methods are
+        looked up when listeners are added, not on every emit.
         
         Args:
             event: Name of the event to emit
@@ -113,16 +141,8 @@ class EventLoop:
             >>> loop.emit("attack_roll", attack_args)
             >>> loop.emit("damage_roll", damage_args, multiplier=2.0)
         """
-        listeners = self.listeners.get(event, [])
-        
-        for listener in listeners:
-            # Check if listener has a handler for this event
-            if hasattr(listener, event):
-                handler = getattr(listener, event)
-                
-                # Call the handler
-                if callable(handler):
-                    handler(*args, **kwargs)
+        for handler in self.handlers.get(event, ()):
+            handler(*args, **kwargs)
 
     def has_listeners(self, event: str) -> bool:
         """
@@ -164,6 +184,7 @@ class EventLoop:
         Useful for cleanup or reset scenarios.
         """
         self.listeners.clear()
+        self.handlers.clear()
 
     def clear_event(self, event: str) -> None:
         """
@@ -174,6 +195,7 @@ class EventLoop:
         """
         if event in self.listeners:
             self.listeners[event].clear()
+            self.handlers[event] = []
 
     def __str__(self) -> str:
         """String representation showing event counts."""
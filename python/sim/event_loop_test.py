@@ -0,0 +1,54 @@
+"""
+Unit tests for the event loop dispatch.
+"""
+from sim.event_loop import EventLoop, Listener
+
+
+class Recorder(Listener):
+    def __init__(self, calls, loop=None):
+        self.calls = calls
+        self.loop = loop
+
+    def enemy_turn(self, target):
+        self.calls.append(self)
+        if self.loop is not None:
+            self.loop.remove(self)
+
+
+class TestEmit:
+    """Test handler dispatch and registration changes."""
+
+    def test_emit_calls_handlers_in_order(self):
+        """Test that handlers run in registration order with the event args."""
+        calls = []
+        loop = EventLoop()
+        first, second = Recorder(calls), Recorder(calls)
+        loop.add(first, "enemy_turn")
+        loop.add(second, ["enemy_turn"])
+
+        loop.emit("enemy_turn", None)
+
+        assert calls == [first, second]
+
+    def test_listener_without_handler_is_skipped(self):
+        """Test that listeners lacking the event method are ignored."""
+        loop = EventLoop()
+        loop.add(Recorder([]), "attack_roll")
+
+        loop.emit("attack_roll", None)
+
+        assert loop.count_listeners("attack_roll") == 1
+
+    def test_removal_during_emit_does_not_skip_next_handler(self):
+        """Test that a listener removing itself does not skip the next one."""
+        calls = []
+        loop = EventLoop()
+        ending = Recorder(calls, loop)
+        other = Recorder(calls)
+        loop.add(ending, "enemy_turn")
+        loop.add(other, "enemy_turn")
+
+        loop.emit("enemy_turn", None)
+        loop.emit("enemy_turn", None)
+
+        assert calls == [ending, other, other]
@@ -4,10 +4,9 @@ Event argument classes for combat system.
 This module defines data classes that carry information about combat events
 like attacks, damage rolls, and saving throws.
 """
-from typing import List, Optional, TypeAlias, Callable, Any, TYPE_CHECKING
-import random
-
+from typing import List, Optional, Sequence, TypeAlias, Callable, Any, TYPE_CHECKING
 from util.log import log
+from util.util import roll_d20
 import util.taggable
 
 if TYPE_CHECKING:
@@ -38,7 +37,7 @@ class AttackArgs(util.taggable.Taggable):
         attack: "sim.attack.Attack",
         weapon: Optional["sim.weapons.Weapon"] = None,
         spell: Optional["sim.spells.Spell"] = None,
-        tags: Optional[List[str]] = None,
+        tags: Optional[Sequence[str]] = None,
     ):
         """
         Initialize attack arguments.
@@ -76,7 +75,7 @@ class AttackRollArgs:
         roll1: First d20 roll
         roll2: Second d20 roll (for advantage/disadvantage)
         situational_bonus: Additional bonus to attack roll
-        min_crit: Override for critical hit threshold (default 20)
+        min_crit: Critical hit threshold (starts at the attack's own)
     """
     
     def __init__(self, attack: AttackArgs, to_hit: int):
@@ -91,10 +90,10 @@ class AttackRollArgs:
         self.to_hit = to_hit
         self.adv = False
         self.disadv = False
-        self.roll1 = random.randint(1, 20)
-        self.roll2 = random.randint(1, 20)
+        self.roll1 = roll_d20()
+        self.roll2 = roll_d20()
         self.situational_bonus = 0
-        self.min_crit: Optional[int] = None
+        self.min_crit: int = attack.attack.min_crit()
 
     def reroll(self) -> None:
         """
@@ -102,8 +101,8 @@ class AttackRollArgs:
         
         Used by features like Lucky or Elven Accuracy.
         """
-        self.roll1 = random.randint(1, 20)
-        self.roll2 = random.randint(1, 20)
+        self.roll1 = roll_d20()
+        self.roll2 = roll_d20()
 
     def roll(self) -> int:
         """
@@ -112,25 +111,32 @@ class AttackRollArgs:
         Returns:
             The d20 roll to use for the attack
         """
+        # Only build the message closures when they will be printed
+        detailed = log.enabled and log.detailed
+        
         # Advantage and disadvantage cancel out
         if self.adv and self.disadv:
-            log.output(lambda: f"Roll (ADV+DIS cancel): {self.roll1}")
+            if detailed:
+                log.output(lambda: f"Roll (ADV+DIS cancel): {self.roll1}")
             return self.roll1
         
         # Advantage: take higher roll
         if self.adv:
             result = max(self.roll1, self.roll2)
-            log.output(lambda: f"Roll (ADV): {self.roll1}, {self.roll2} = {result}")
+            if detailed:
+                log.output(lambda: f"Roll (ADV): {self.roll1}, {self.roll2} = {result}")
             return result
         
         # Disadvantage: take lower roll
         if self.disadv:
             result = min(self.roll1, self.roll2)
-            log.output(lambda: f"Roll (DIS): {self.roll1}, {self.roll2} = {result}")
+            if detailed:
+                log.output(lambda: f"Roll (DIS): {self.roll1}, {self.roll2} = {result}")
             return result
         
         # Normal roll
-        log.output(lambda: f"Roll: {self.roll1}")
+        if detailed:
+            log.output(lambda: f"Roll: {self.roll1}")
         return self.roll1
 
     def hits(self) -> bool:
@@ -195,7 +201,7 @@ class AttackResultArgs:
     def add_damage(
         self,
         source: str,
-        dice: Optional[List[int]] = None,
+        dice: Optional[Sequence[int]] = None,
         damage: int = 0,
         damage_type: str = "physical",
     ) -> None:
@@ -60,6 +60,13 @@ class Feat(Listener):
     Attributes:
         character: Character this feat is attached to
     """
+
+    # Feats are instantiated for every character build, so hot subclasses
+    # declare __slots__ for their own state; those without keep a __dict__
+    __slots__ = ("character",)
+
+    # Event methods overridden by this class, filled in by __init_subclass__
+    _event_names: tuple[str, ...] = ()
     
     def name(self) -> str:
         """
@@ -89,26 +96,22 @@ class Feat(Listener):
         Automatically detect which events this feat responds to.
         
         Checks for methods matching event names that have been
-        overridden from the base Feat class.
+        overridden from the base Feat class. The scan runs once per
+        subclass in __init_subclass__, so this is a plain lookup.
         
         Returns:
             List of event names this feat handles
         """
-        events: list[str] = []
-        
-        for method_name in dir(self):
-            # Check if it's a valid event name
-            if method_name not in EVENT_NAMES:
-                continue
-            
-            # Check if method was overridden from base Feat
-            feat_method = getattr(Feat, method_name)
-            subclass_method = getattr(type(self), method_name)
-            
-            if feat_method != subclass_method:
-                events.append(method_name)
-        
-        return events
+        return list(type(self)._event_names)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Record which event methods the new subclass overrides."""
+        super().__init_subclass__(**kwargs)
+        cls._event_names = tuple(
+            name
+            for name in sorted(EVENT_NAMES)
+            if getattr(cls, name, None) is not getattr(Feat, name, None)
+        )
 
     # =============================
     #       TURN EVENTS
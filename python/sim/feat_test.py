@@ -0,0 +1,27 @@
+"""
+Unit tests for feat event discovery.
+"""
+from sim.feat import Feat
+
+
+class Base(Feat):
+    def attack_roll(self, args):
+        pass
+
+
+class Child(Base):
+    def begin_turn(self, target):
+        pass
+
+
+class TestEvents:
+    """Test which events a feat is registered for."""
+
+    def test_base_feat_handles_no_events(self):
+        """Test that the base class overrides nothing."""
+        assert Feat().events() == []
+
+    def test_inherited_overrides_are_included(self):
+        """Test that overrides from parent classes are reported in order."""
+        assert Base().events() == ["attack_roll"]
+        assert Child().events() == ["attack_roll", "begin_turn"]
@@ -3,7 +3,7 @@ from typing import Dict, List, Optional
 from collections import defaultdict
 
 from util.taggable import Taggable
-from util.util import do_roll
+from util.util import do_roll, roll_d20
 from sim.spells import Spellcasting, Spellcaster
 from sim.event_loop import EventLoop
 
@@ -242,7 +242,7 @@ class BaseMonster(Taggable):
         Returns:
             True if save succeeded, False otherwise
         """
-        roll = random.randint(1, 20)
+        roll = roll_d20()
         save_bonus = self.get_save_bonus(ability)
         total = roll + save_bonus
         
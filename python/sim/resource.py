@@ -217,7 +217,8 @@ class Resource(sim.event_loop.Listener):
             raise ValueError(f"Cannot use negative amount: {amount}")
         
         if self.num >= amount:
-            log.record(f"Resource ({self.name})", amount)
+            if log.enabled:
+                log.record(f"Resource ({self.name})", amount)
             self.num -= amount
             if detail:
                 log_detail = f"Round {self.character.current_round}: {detail}"
@@ -366,7 +367,8 @@ class WarlockPactSlots(Resource):
             True if slot was available and used, False otherwise
         """
         if self.num >= amount:
-            log.record(f"{self.name} ({self.slot_level}th)", amount)
+            if log.enabled:
+                log.record(f"{self.name} ({self.slot_level}th)", amount)
             self.num -= amount
             if detail:
                 log_detail = f"Round {self.character.current_round}: {detail} (Level {self.slot_level})"
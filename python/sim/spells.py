@@ -9,10 +9,11 @@ import math
 from enum import Enum
 
 from util.log import log
-from util.util import spell_slots, highest_spell_slot, lowest_spell_slot
+from util.util import spell_slots, highest_spell_slot, lowest_spell_slot, cantrip_dice
 import util.taggable
 import sim.event_loop
 from sim.resource import WarlockPactSlots
+from sim.attack import DamageRoll
 
 if TYPE_CHECKING:
     import sim.target
@@ -280,7 +281,8 @@ class Spellcasting(sim.event_loop.Listener):
             target: Target of the spell
             ignore_slot: If True, don't consume a slot (e.g., for cantrips)
         """
-        log.record(f"Cast ({spell.name})", 1)
+        if log.enabled:
+            log.record(f"Cast ({spell.name})", 1)
         
         # Consume spell slot
         if spell.slot > 0 and not ignore_slot:
@@ -367,13 +369,7 @@ class Spellcasting(sim.event_loop.Listener):
         Returns:
             Number of dice (1-4)
         """
-        if self.character.level >= 17:
-            return 4
-        elif self.character.level >= 11:
-            return 3
-        elif self.character.level >= 5:
-            return 2
-        return 1
+        return cantrip_dice(self.character.level)
 
     def __str__(self) -> str:
         """String representation showing slots."""
@@ -656,10 +652,9 @@ class BasicSaveSpell(Spell):
         saved = target.save(self.save_ability, dc)
         
         # Deal damage (half if saved)
-        import sim.attack
         character.do_damage(
             target,
-            damage=sim.attack.DamageRoll(
+            damage=DamageRoll(
                 source=self.name,
                 dice=self.dice,
                 flat_dmg=self.flat_dmg,
@@ -722,8 +717,7 @@ class AttackSpell(Spell):
         super().cast(character, target)
         
         # Make spell attack
-        import sim.attack
-        damage = sim.attack.DamageRoll.from_dice_notation(
+        damage = DamageRoll.from_dice_notation(
             source=self.name,
             num_dice=len(self.dice),
             die=self.dice[0] if self.dice else 0,
@@ -852,10 +846,9 @@ class AreaSpell(Spell):
         saved = target.save(self.save_ability, dc)
         
         # Deal damage
-        import sim.attack
         character.do_damage(
             target,
-            damage=sim.attack.DamageRoll(
+            damage=DamageRoll(
                 source=self.name,
                 dice=self.dice,
                 flat_dmg=self.flat_dmg,
@@ -50,7 +50,7 @@ class Summon(sim.character.Character):
         base_feats.extend(feats)
         super().__init__(
             level=1,
-            stats=[10, 10, 10, 10, 10, 10],
+            stats=(10, 10, 10, 10, 10, 10),
             base_feats=base_feats,
         )
 
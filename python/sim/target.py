@@ -6,9 +6,8 @@ with level-appropriate AC and saving throws.
 """
 from typing import Dict, Optional
 from collections import defaultdict
-import random
 
-from util.util import prof_bonus
+from util.util import prof_bonus, roll_d20
 from util.log import log
 from util.taggable import Taggable
 
@@ -155,14 +154,16 @@ class Target(Taggable):
             Currently uses same bonus for all saves. Real monsters
             would have different bonuses for different saves.
         """
-        roll = random.randint(1, 20)
+        roll = roll_d20()
         total = roll + self.save_bonus
         
         success = total >= dc
-        log.output(
-            lambda: f"Target {ability.upper()} save: {roll} + {self.save_bonus} "
-                    f"= {total} vs DC {dc} ({'SUCCESS' if success else 'FAIL'})"
-        )
+        # Only build the message closure when it will be printed
+        if log.enabled and log.detailed:
+            log.output(
+                lambda: f"Target {ability.upper()} save: {roll} + {self.save_bonus} "
+                        f"= {total} vs DC {dc} ({'SUCCESS' if success else 'FAIL'})"
+            )
         
         return success
 
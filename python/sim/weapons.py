@@ -51,6 +51,7 @@ class Weapon(Taggable):
         self.name = name or "UnknownWeapon"
         self.num_dice = num_dice
         self.die = die
+        self.dice = (die,) * num_dice
         self.damage_type = damage_type
         self._min_crit = min_crit
         self.attack_bonus = magic_bonus + attack_bonus
@@ -88,7 +89,7 @@ class Weapon(Taggable):
                 mod = self.mod(character)
                 damage += character.mod(mod)
             args.add_damage(
-                source=self.name, dice=self.num_dice * [self.die], damage=damage, damage_type=self.damage_type
+                source=self.name, dice=self.dice, damage=damage, damage_type=self.damage_type
             )
 
     def min_crit(self) -> int:
@@ -46,7 +46,7 @@ class DivineFavor(sim.spells.ConcentrationSpell, sim.event_loop.Listener):
 
     def attack_result(self, args: "sim.events.AttackResultArgs"):
         if args.hits() and args.attack.weapon is not None:
-            args.add_damage(source=self.name, dice=[4])
+            args.add_damage(source=self.name, dice=(4,))
 
 
 class HolyWeapon(sim.spells.ConcentrationSpell):
@@ -64,4 +64,4 @@ class HolyWeapon(sim.spells.ConcentrationSpell):
 
     def attack_result(self, args: "sim.events.AttackResultArgs"):
         if args.hits() and args.attack.weapon is self.weapon:
-            args.add_damage(source=self.name, dice=[8, 8])
+            args.add_damage(source=self.name, dice=(8, 8))
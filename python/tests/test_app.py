@@ -17,7 +17,7 @@ import pytest
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app import app as flask_app, SessionKeys
+from app import app as flask_app, SessionKeys, CombatStore
 
 
 @pytest.fixture
@@ -356,6 +356,151 @@ class TestSessionManagement:
         assert data['rounds'] == 0 or data['rounds'] == 1
 
 
+class TestCombatStore:
+    """Tests for the server-side combat state store."""
+    
+    def test_round_trip(self):
+        """Test that a stored state is returned unchanged."""
+        store = CombatStore()
+        state = {'rounds': 2, 'turn_order': ['Fighter', 'Goblin'], 'log': ['hit']}
+        
+        combat_id = store.save(state)
+        
+        assert store.load(combat_id) == state
+    
+    def test_session_only_holds_combat_id(self, client, sample_combat_config):
+        """Test that the session cookie carries an id rather than the state."""
+        client.post(
+            '/api/start_combat',
+            data=json.dumps(sample_combat_config),
+            content_type='application/json'
+        )
+        
+        with client.session_transaction() as sess:
+            assert list(sess.keys()) == [SessionKeys.COMBAT_ID]
+            assert isinstance(sess[SessionKeys.COMBAT_ID], str)
+    
+    def test_delete(self):
+        """Test that deleted states can no longer be loaded."""
+        store = CombatStore()
+        combat_id = store.save({'rounds': 0})
+        
+        store.delete(combat_id)
+        
+        assert store.load(combat_id) is None
+    
+    def test_abandoned_states_are_evicted(self):
+        """Test that in-memory states past their TTL are dropped on the next save."""
+        store = CombatStore(ttl=0, max_log_entries=1)
+        abandoned = store.save({'rounds': 1, 'log': ['a', 'b']})
+        
+        active = store.save({'rounds': 2})
+        
+        assert store.load(abandoned) is None
+        assert store.full_log(abandoned) is None
+        assert abandoned not in store._log_archives
+        assert store.load(active) == {'rounds': 2}
+    
+    def test_redis_backend(self):
+        """Test that states are stored in Redis with a TTL when a client is given."""
+        class FakeRedis:
+            def __init__(self):
+                self.data = {}
+                self.expiry = {}
+            
+            def set(self, key, value, ex=None):
+                self.data[key] = value
+                self.expiry[key] = ex
+            
+            def get(self, key):
+                return self.data.get(key)
+            
+            def delete(self, *keys):
+                for key in keys:
+                    self.data.pop(key, None)
+            
+            def rpush(self, key, *values):
+                self.data.setdefault(key, []).extend(values)
+            
+            def lrange(self, key, start, end):
+                return list(self.data.get(key, []))
+            
+            def expire(self, key, seconds):
+                if key in self.data:
+                    self.expiry[key] = seconds
+        
+        redis_client = FakeRedis()
+        store = CombatStore(redis_client, ttl=60, max_log_entries=1)
+        
+        combat_id = store.save({'rounds': 3, 'log': ['a', 'b']})
+        log_key = CombatStore.LOG_KEY_PREFIX + combat_id
+        
+        assert redis_client.expiry[CombatStore.KEY_PREFIX + combat_id] == 60
+        assert store.load(combat_id) == {'rounds': 3, 'log': ['b']}
+        assert store.full_log(combat_id) == ['a', 'b']
+        
+        # Saves that archive nothing still keep the archive alive
+        redis_client.expiry[log_key] = 1
+        store.save({'rounds': 4, 'log': ['b']}, combat_id)
+        assert redis_client.expiry[log_key] == 60
+        
+        store.delete(combat_id)
+        assert store.load(combat_id) is None
+        assert log_key not in redis_client.data
+    
+    def test_log_is_trimmed_and_archived(self):
+        """Test that old log entries leave the stored state but stay in the full log."""
+        store = CombatStore(max_log_entries=3)
+        
+        combat_id = store.save({'rounds': 1, 'log': ['a', 'b', 'c', 'd']})
+        state = store.load(combat_id)
+        state['log'] += ['e', 'f']
+        store.save(state, combat_id)
+        
+        assert store.load(combat_id)['log'] == ['d', 'e', 'f']
+        assert store.full_log(combat_id) == ['a', 'b', 'c', 'd', 'e', 'f']
+    
+    def test_new_combat_does_not_inherit_archived_log(self, client, monkeypatch):
+        """Test that restarting a combat drops the previous combat's log archive."""
+        monkeypatch.setattr('app.combat_store', CombatStore(max_log_entries=3))
+        config = {
+            "level": 1,
+            "party": ["fighter"],
+            "enemies": [{"name": "goblin", "count": 4}]
+        }
+        client.post(
+            '/api/start_combat',
+            data=json.dumps(config),
+            content_type='application/json'
+        )
+        for _ in range(5):
+            client.post('/api/next_turn')
+        
+        start_data = client.post(
+            '/api/start_combat',
+            data=json.dumps(config),
+            content_type='application/json'
+        ).get_json()
+        
+        response = client.get('/api/combat_log')
+        
+        assert response.get_json()['log'] == start_data['log']
+    
+    def test_combat_log_endpoint(self, client, sample_combat_config):
+        """Test that the full combat log is served for the active combat."""
+        client.post(
+            '/api/start_combat',
+            data=json.dumps(sample_combat_config),
+            content_type='application/json'
+        )
+        turn_data = client.post('/api/next_turn').get_json()
+        
+        response = client.get('/api/combat_log')
+        
+        assert response.status_code == 200
+        assert response.get_json()['log'] == turn_data['log']
+
+
 class TestErrorHandling:
     """Tests for error handling and edge cases."""
     
@@ -1,6 +1,10 @@
 import unittest
 import sys
 import os
+import json
+import tempfile
+import types
+from unittest import mock
 
 # Add the parent directory to the sys.path to allow for absolute imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -10,6 +14,7 @@ import configs
 import monster_configs
 import sim.party_sim
 from monsters.goblin import Goblin
+from sim.character import Character
 from simulator_exceptions import CharacterLoadException
 
 
@@ -61,6 +66,52 @@ class TestCombatManager(unittest.TestCase):
         with self.assertRaises(CharacterLoadException):
             manager.create_party_instances()
 
+    def _custom_character_manager(self):
+        """Crea un manager y un archivo JSON de personaje personalizado."""
+        def make_character(level, **kwargs):
+            return Character(level=level, stats=[12] * 6, **kwargs)
+
+        fake_configs = types.SimpleNamespace(
+            CONFIGS={}, CLASS_REGISTRY={"Custom": make_character}
+        )
+        config = CombatConfig(party_members=["custom"], enemies=[(Goblin, 1)], level=3)
+        manager = CombatManager(
+            config=config,
+            configs_module=fake_configs,
+            monster_configs_module=self.monster_configs_module,
+            party_sim_module=self.party_sim_module
+        )
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, "custom.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"class": "Custom", "args": {"ac": 17}}, f)
+        return manager, path
+
+    def test_custom_character_file_read_once(self):
+        """Verifica que el JSON de un personaje personalizado se lee una sola vez."""
+        manager, path = self._custom_character_manager()
+
+        with mock.patch("combat_manager.json.load", wraps=json.load) as load:
+            first = manager._load_custom_character(path, "custom", 3)
+            second = manager._load_custom_character(path, "custom", 3)
+
+        self.assertEqual(load.call_count, 1, "El archivo debería leerse una sola vez")
+        self.assertIsNot(first, second, "Cada carga debe devolver una copia independiente")
+        self.assertEqual(second.ac, 17)
+
+    def test_custom_character_cache_is_per_key(self):
+        """Verifica que dos claves del mismo archivo no comparten la configuración."""
+        manager, path = self._custom_character_manager()
+
+        with mock.patch("combat_manager.json.load", wraps=json.load) as load:
+            first = manager._load_custom_character(path, "first", 3)
+            manager._load_custom_character(path, "second", 3)
+
+        self.assertEqual(load.call_count, 2, "Cada clave debería tener su propia configuración")
+        self.assertEqual(first.name, "Unnamed Character")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,27 +1,24 @@
-from typing import Set, List, Optional
+from typing import Optional, Sequence, Set
 
 
 class Taggable:
     tags: Optional[Set[str]] = None
 
     def has_tag(self, tag: str):
-        if not self.tags:
-            self.tags = set()
-        return tag in self.tags
+        # Queries never allocate; the set is created on the first add
+        tags = self.tags
+        return tags is not None and tag in tags
 
     def add_tag(self, tag: str):
-        if not self.tags:
+        if self.tags is None:
             self.tags = set()
         self.tags.add(tag)
 
-    def add_tags(self, tags: List[str]):
-        if not self.tags:
+    def add_tags(self, tags: Sequence[str]):
+        if self.tags is None:
             self.tags = set()
-        for tag in tags:
-            self.add_tag(tag)
+        self.tags.update(tags)
 
     def remove_tag(self, tag: str):
-        if not self.tags:
-            self.tags = set()
-        if tag in self.tags:
-            self.tags.remove(tag)
+        if self.tags is not None:
+            self.tags.discard(tag)
@@ -1,4 +1,5 @@
-from typing import Optional, Any, List, Tuple
+from typing import Optional, Any, Dict, List, Sequence, Tuple
+import os
 import random
 import math
 
@@ -29,6 +30,31 @@ SPELL_SLOTS_ARR = [
 ]
 
 
+MAX_LEVEL = 20
+
+
+# Expands a {min_level: value} threshold map into a tuple indexed by level
+# (0-20), so per-level lookups are a single index instead of a threshold scan
+def level_table(thresholds: Dict[int, Any], default: Any) -> Tuple[Any, ...]:
+    table = []
+    value = default
+    for level in range(MAX_LEVEL + 1):
+        value = thresholds.get(level, value)
+        table.append(value)
+    return tuple(table)
+
+
+# Reads a level_table entry. Levels past either end read the nearest entry,
+# as the threshold checks the tables replace did, instead of wrapping
+# around (negative index) or raising IndexError
+def at_level(table: Tuple[Any, ...], level: int) -> Any:
+    if level < 0:
+        return table[0]
+    if level > MAX_LEVEL:
+        return table[MAX_LEVEL]
+    return table[level]
+
+
 def spell_slots(level: int, half: bool = False):
     if half:
         level = math.ceil(level / 2)
@@ -39,38 +65,78 @@ def prof_bonus(level: int) -> int:
     return ((level - 1) // 4) + 2
 
 
+_MAGIC_WEAPON_BONUS = level_table({5: 1, 10: 2, 15: 3}, default=0)
+
+
 def get_magic_weapon(level: int):
-    if level >= 15:
-        return 3
-    elif level >= 10:
-        return 2
-    elif level >= 5:
-        return 1
-    return 0
+    return at_level(_MAGIC_WEAPON_BONUS, level)
+
+
+# Damage dice are rolled as int(random() * size) + 1: a single C call per
+# die instead of randint's range checks and _randbelow dispatch. This is
+# still the shared global generator, so random.seed() (e.g. DND_SEED) applies.
+_random = random.random
+
+# d20s are drawn from the global generator in batches: random.choices costs
+# a fraction of a random.randint call per roll
+D20_FACES = tuple(range(1, 21))
+D20_BATCH_SIZE = 4096
+_d20_rolls: List[int] = []
+
+
+def roll_d20() -> int:
+    if not _d20_rolls:
+        _d20_rolls.extend(random.choices(D20_FACES, k=D20_BATCH_SIZE))
+    return _d20_rolls.pop()
+
+
+# Drops buffered d20s so that rolls made after random.seed() come from the
+# new seed
+def reset_dice() -> None:
+    _d20_rolls.clear()
+
+
+# random reseeds itself in forked children but the buffer would be copied
+# as is, handing every worker the parent's pre-drawn d20s
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_dice)
 
 
 def do_roll(adv: bool = False, disadv: bool = False) -> int:
     if adv and disadv:
-        return random.randint(1, 20)
+        return roll_d20()
     elif adv:
-        return max(random.randint(1, 20), random.randint(1, 20))
+        return max(roll_d20(), roll_d20())
     elif disadv:
-        return min(random.randint(1, 20), random.randint(1, 20))
-    return random.randint(1, 20)
+        return min(roll_d20(), roll_d20())
+    return roll_d20()
 
 
 def roll_dice(num: int, size: int, max_reroll: int = 0) -> int:
+    # Only build the per-roll message closures when they will be printed
+    detailed = log.enabled and log.detailed
     total = 0
     for _ in range(num):
-        roll = random.randint(1, size)
-        log.output(lambda: f"\tRoll {roll} on d{size}")
+        roll = int(_random() * size) + 1
+        if detailed:
+            log.output(lambda: f"\tRoll {roll} on d{size}")
         if roll <= max_reroll:
-            roll = random.randint(1, size)
-            log.output(lambda: f"\t\tReroll {roll} on d{size}")
+            roll = int(_random() * size) + 1
+            if detailed:
+                log.output(lambda: f"\t\tReroll {roll} on d{size}")
         total += roll
     return total
 
 
+# Rolls one die of each size in dice, e.g. [6, 6, 8] for 2d6 + 1d8
+def roll_each(dice: Sequence[int]) -> List[int]:
+    rolls = [int(_random() * size) + 1 for size in dice]
+    if log.enabled and log.detailed:
+        for roll, size in zip(rolls, dice):
+            log.output(lambda: f"\tRoll {roll} on d{size}")
+    return rolls
+
+
 def highest_spell_slot(slots: List[int], max: int = 9) -> int:
     # Finds the highest level spell slot available
     slot = max
@@ -90,14 +156,11 @@ def lowest_spell_slot(slots: List[int], min: int = 1) -> int:
     return 0
 
 
+_CANTRIP_DICE = level_table({5: 2, 11: 3, 17: 4}, default=1)
+
+
 def cantrip_dice(level: int):
-    if level >= 17:
-        return 4
-    elif level >= 11:
-        return 3
-    elif level >= 5:
-        return 2
-    return 1
+    return at_level(_CANTRIP_DICE, level)
 
 
 def safe_cast[T](cls: type[T], obj: Any) -> Optional[T]:
@@ -109,7 +172,7 @@ def safe_cast[T](cls: type[T], obj: Any) -> Optional[T]:
 
 def apply_feats_at_levels[
     T
-](level: int, feats: List[T], schedule: List[int], new_feats: List[T]):
+](level: int, feats: List[T], schedule: Sequence[int], new_feats: Sequence[T]):
     if not schedule or not new_feats:
         return
     for target, feat in zip(schedule, new_feats):
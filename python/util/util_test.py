@@ -0,0 +1,41 @@
+"""
+Unit tests for the dice helpers.
+"""
+import multiprocessing
+
+import pytest
+
+from util.util import cantrip_dice, get_magic_weapon, roll_d20
+
+
+def _roll_d20s(_):
+    return [roll_d20() for _ in range(8)]
+
+
+class TestRollD20:
+    """Test the buffered d20 rolls."""
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(),
+        reason="needs the fork start method",
+    )
+    def test_forked_workers_do_not_share_buffered_rolls(self):
+        """Test that workers forked after a roll draw their own d20s."""
+        roll_d20()  # Fill the parent's buffer before forking
+        with multiprocessing.get_context("fork").Pool(4) as pool:
+            worker_rolls = pool.map(_roll_d20s, range(4), chunksize=1)
+
+        parent_rolls = _roll_d20s(None)
+        assert parent_rolls not in worker_rolls
+        assert len(set(map(tuple, worker_rolls))) == len(worker_rolls)
+
+
+class TestLevelTables:
+    """Test per-level table lookups."""
+
+    def test_levels_outside_the_table_read_the_nearest_entry(self):
+        """Test that out-of-range levels clamp instead of wrapping or raising."""
+        assert cantrip_dice(-1) == cantrip_dice(0) == 1
+        assert cantrip_dice(25) == cantrip_dice(20) == 4
+        assert get_magic_weapon(-3) == 0
+        assert get_magic_weapon(30) == 3